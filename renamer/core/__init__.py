@@ -1,12 +1,23 @@
 """Core utilities - __init__."""
 
-from .hash_strategy import SHA256HashComputer, MD5HashComputer
+from .hash_strategy import (
+    SHA256HashComputer,
+    UringSHA256HashComputer,
+    BLAKE3HashComputer,
+    LocalMD5HashComputer,
+    MD5HashComputer,
+)
 from .sidecar import SidecarManager
 from .sanitizer import FilenameSanitizer
+from .rclone_rc import RcloneRCClient
 
 __all__ = [
     'SHA256HashComputer',
+    'UringSHA256HashComputer',
+    'BLAKE3HashComputer',
+    'LocalMD5HashComputer',
     'MD5HashComputer',
     'SidecarManager',
     'FilenameSanitizer',
+    'RcloneRCClient',
 ]
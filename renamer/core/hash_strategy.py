@@ -2,16 +2,125 @@
 Hash computation strategies.
 
 Strategy pattern implementation for different hash algorithms.
-Fixes the algorithm inconsistency: allows choosing SHA256 or MD5 explicitly.
+Fixes the algorithm inconsistency: allows choosing SHA256, BLAKE3 or MD5 explicitly.
 """
 
 from __future__ import annotations
+import functools
 import hashlib
+import io
+import json
+import os
 import subprocess
+import sys
+import threading
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Any, Literal, Optional
 import logging
 
+from .rclone_rc import RcloneRCClient, parse_rclone_json
+
+try:
+    import blake3
+except ImportError:  # optional dependency
+    blake3 = None  # type: ignore[assignment]
+
+try:
+    import liburing  # type: ignore[import-untyped]
+except ImportError:  # optional dependency, Linux only
+    liburing = None
+
+
+# Default read size for local hashing: large enough that each update() call
+# runs a long native loop with the GIL released
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+# hashlib.file_digest (3.11+) runs the read/update loop in C
+_HAS_FILE_DIGEST = sys.version_info >= (3, 11)
+
+# Reads kept in flight per file by UringSHA256HashComputer
+DEFAULT_URING_DEPTH = 8
+
+
+# Hashing 1 MiB slower than this means OpenSSL has no SHA extensions
+# (SHA-NI / ARMv8 SHA2): roughly 2 GB/s with them, 400-500 MB/s without
+_SHA256_FAST_SECONDS_PER_MIB = 1.5e-3
+
+
+@functools.lru_cache(maxsize=None)
+def sha256_is_accelerated() -> bool:
+    """
+    Check once per process whether hashlib's SHA256 is hardware-accelerated.
+    
+    Times a 1 MiB digest (best of 5) against a threshold. Logs a warning
+    recommending BLAKE3 when SHA256 runs on the portable code path. Run by
+    get_hash_computer(prefer_fastest=True) and by the factory when it
+    builds a local SHA256 hasher, not by hasher constructors; the result
+    is cached.
+    
+    Returns:
+        True if SHA256 throughput indicates CPU SHA extensions
+    """
+    data = bytes(1 << 20)
+    best = float('inf')
+    for _ in range(5):
+        start = time.perf_counter()
+        hashlib.sha256(data).digest()
+        best = min(best, time.perf_counter() - start)
+    
+    accelerated = best < _SHA256_FAST_SECONDS_PER_MIB
+    if not accelerated:
+        logging.getLogger(__name__).warning(
+            "SHA256 is not hardware-accelerated here (%.0f MB/s); BLAKE3 hashes "
+            "local files much faster (pip install blake3)",
+            len(data) / best / 1e6
+        )
+    return accelerated
+
+
+# Per-thread read buffers for _update_from_file, reused across files
+_read_buffers = threading.local()
+
+
+def _read_buffer(chunk_size: int) -> tuple[bytearray, memoryview]:
+    """Return this thread's read buffer of chunk_size bytes and a view on it."""
+    buffers: Optional[dict[int, tuple[bytearray, memoryview]]] = getattr(
+        _read_buffers, 'by_size', None
+    )
+    if buffers is None:
+        buffers = _read_buffers.by_size = {}
+    entry = buffers.get(chunk_size)
+    if entry is None:
+        buf = bytearray(chunk_size)
+        entry = buffers[chunk_size] = (buf, memoryview(buf))
+    return entry
+
+
+def _update_from_file(hasher: Any, f: io.RawIOBase, chunk_size: int) -> None:
+    """Feed an unbuffered binary file into a hash object through the thread's buffer."""
+    buf, view = _read_buffer(chunk_size)
+    while n := f.readinto(buf):
+        hasher.update(view[:n])
+
+
+def _digest_file(file_path: Path, name: str, chunk_size: int) -> Any:
+    """
+    Hash a local file with a hashlib algorithm; returns the hash object.
+    
+    Uses hashlib.file_digest when available, else a readinto() loop.
+    
+    Raises:
+        IOError: If file cannot be read
+    """
+    # Unbuffered: the digest loop manages its own read buffer
+    with open(file_path, 'rb', buffering=0) as f:
+        if _HAS_FILE_DIGEST:
+            return hashlib.file_digest(f, name)
+        hasher = hashlib.new(name)
+        _update_from_file(hasher, f, chunk_size)
+        return hasher
+
 
 class SHA256HashComputer:
     """
@@ -29,12 +138,13 @@ class SHA256HashComputer:
         'sha256'
     """
     
-    def __init__(self, chunk_size: int = 8192):
+    def __init__(self, chunk_size: int = DEFAULT_CHUNK_SIZE):
         """
         Initialize SHA256 hash computer.
         
         Args:
-            chunk_size: Bytes to read per iteration (default 8KB)
+            chunk_size: Bytes to read per iteration (default 1MB).
+                Only used where hashlib.file_digest is unavailable.
         """
         self._chunk_size = chunk_size
         self._logger = logging.getLogger(__name__)
@@ -52,15 +162,241 @@ class SHA256HashComputer:
         Raises:
             IOError: If file cannot be read
         """
+        try:
+            hash_value: str = _digest_file(file_path, 'sha256', self._chunk_size).hexdigest()
+            self._logger.debug("SHA256 hash computed for %s: %s", file_path, hash_value)
+            return hash_value
+            
+        except IOError as e:
+            self._logger.error(f"Failed to compute SHA256 hash for {file_path}: {e}")
+            raise
+    
+    @property
+    def algorithm_name(self) -> str:
+        """Return algorithm name for sidecar metadata."""
+        return 'sha256'
+
+
+class LocalMD5HashComputer:
+    """
+    Compute MD5 hashes for local files in-process.
+    
+    Produces the same digests rclone reports for remotes, without
+    spawning rclone for each local file.
+    
+    Thread-safe and stateless.
+    
+    Example:
+        >>> computer = LocalMD5HashComputer()
+        >>> hash_value = computer.compute_hash(Path("file.txt"))
+        >>> computer.algorithm_name
+        'md5'
+    """
+    
+    def __init__(self, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Initialize local MD5 hash computer.
+        
+        Args:
+            chunk_size: Bytes to read per iteration (default 1MB).
+                Only used where hashlib.file_digest is unavailable.
+        """
+        self._chunk_size = chunk_size
+        self._logger = logging.getLogger(__name__)
+    
+    def compute_hash(self, file_path: Path) -> str:
+        """
+        Compute MD5 hash of file contents.
+        
+        Args:
+            file_path: Path to local file
+        
+        Returns:
+            Hexadecimal MD5 hash string
+        
+        Raises:
+            IOError: If file cannot be read
+        """
+        try:
+            hash_value: str = _digest_file(file_path, 'md5', self._chunk_size).hexdigest()
+            self._logger.debug("MD5 hash computed for %s: %s", file_path, hash_value)
+            return hash_value
+            
+        except IOError as e:
+            self._logger.error(f"Failed to compute MD5 hash for {file_path}: {e}")
+            raise
+    
+    @property
+    def algorithm_name(self) -> str:
+        """Return algorithm name for sidecar metadata."""
+        return 'md5'
+
+
+class _UringState:
+    """Per-thread io_uring instance with its read buffers."""
+    
+    def __init__(self, depth: int, chunk_size: int):
+        self.ring = liburing.Ring()
+        self.cqe = liburing.Cqe()
+        liburing.io_uring_queue_init(depth, self.ring)
+        self.buffers = [bytearray(chunk_size) for _ in range(depth)]
+        self.views = [memoryview(buf) for buf in self.buffers]
+    
+    def reap(self) -> tuple[int, int]:
+        """
+        Wait for one completion and return its (user_data, res).
+        
+        Raises:
+            OSError: If the read failed (the completion is consumed)
+        """
+        try:
+            liburing.io_uring_wait_cqe(self.ring, self.cqe)
+            entry = self.cqe[0]
+            result = (entry.user_data, entry.res)
+        except OSError:
+            # liburing raises for failed completions; drop the entry
+            liburing.io_uring_cq_advance(self.ring, 1)
+            raise
+        liburing.io_uring_cqe_seen(self.ring, entry)
+        return result
+    
+    def __del__(self) -> None:
+        liburing.io_uring_queue_exit(self.ring)
+
+
+class UringSHA256HashComputer:
+    """
+    Compute SHA256 hashes for local files, reading through io_uring.
+    
+    Keeps several chunk reads of the same file in flight so the device
+    queue stays busy while earlier chunks are hashed. Each thread gets its
+    own ring and fixed set of buffers. Requires Linux and the optional
+    ``liburing`` package; produces the same digests as SHA256HashComputer.
+    
+    Thread-safe.
+    
+    Example:
+        >>> computer = UringSHA256HashComputer()
+        >>> hash_value = computer.compute_hash(Path("file.txt"))
+        >>> computer.algorithm_name
+        'sha256'
+    """
+    
+    def __init__(
+        self,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        queue_depth: int = DEFAULT_URING_DEPTH
+    ):
+        """
+        Initialize io_uring SHA256 hash computer.
+        
+        Args:
+            chunk_size: Bytes per read request (default 1MB)
+            queue_depth: Read requests kept in flight per file
+        
+        Raises:
+            ImportError: If not on Linux or liburing is not installed
+        """
+        if liburing is None or not sys.platform.startswith('linux'):
+            raise ImportError(
+                "io_uring hashing requires Linux and the 'liburing' package (pip install liburing)"
+            )
+        self._chunk_size = chunk_size
+        self._queue_depth = queue_depth
+        self._local = threading.local()
+        self._logger = logging.getLogger(__name__)
+    
+    def _state(self) -> _UringState:
+        """Return this thread's ring, creating it on first use."""
+        state: Optional[_UringState] = getattr(self._local, 'state', None)
+        if state is None:
+            state = _UringState(self._queue_depth, self._chunk_size)
+            self._local.state = state
+        return state
+    
+    def _hash_fd(self, fd: int) -> Any:
+        """Hash an open file descriptor; returns the sha256 object."""
+        state = self._state()
         sha256 = hashlib.sha256()
+        size = os.fstat(fd).st_size
+        chunk_size = self._chunk_size
+        depth = self._queue_depth
+        
+        submitted = 0  # chunks submitted so far
+        fed = 0  # chunks passed to sha256 so far
+        done: dict[int, int] = {}  # completed chunk index -> bytes read
+        inflight = 0
+        error: Optional[OSError] = None
+        short_at: Optional[int] = None  # offset where a short read stopped
+        
+        while True:
+            # Refill free buffer slots while no error or short read occurred
+            while (error is None and short_at is None
+                   and submitted - fed < depth and submitted * chunk_size < size):
+                sqe = liburing.io_uring_get_sqe(state.ring)
+                liburing.io_uring_prep_read(
+                    sqe, fd, state.buffers[submitted % depth], submitted * chunk_size
+                )
+                liburing.io_uring_sqe_set_data64(sqe, submitted)
+                submitted += 1
+                inflight += 1
+            
+            if inflight == 0:
+                break
+            
+            liburing.io_uring_submit(state.ring)
+            try:
+                index, n = state.reap()
+            except OSError as e:
+                error = error or e
+                inflight -= 1
+                continue
+            inflight -= 1
+            done[index] = n
+            
+            # Feed completed chunks in file order
+            while error is None and short_at is None and fed in done:
+                n = done.pop(fed)
+                sha256.update(state.views[fed % depth][:n])
+                if n < chunk_size and (fed + 1) * chunk_size < size:
+                    short_at = fed * chunk_size + n
+                fed += 1
+        
+        if error is not None:
+            raise error
+        
+        # Read whatever the ring did not cover: the tail after a short read,
+        # or data appended since fstat
+        offset = short_at if short_at is not None else fed * chunk_size
+        view = state.views[0]
+        while n := os.preadv(fd, [state.buffers[0]], offset):
+            sha256.update(view[:n])
+            offset += n
+        
+        return sha256
+    
+    def compute_hash(self, file_path: Path) -> str:
+        """
+        Compute SHA256 hash of file contents.
         
+        Args:
+            file_path: Path to local file
+        
+        Returns:
+            Hexadecimal SHA256 hash string
+        
+        Raises:
+            IOError: If file cannot be read
+        """
         try:
-            with open(file_path, 'rb') as f:
-                while chunk := f.read(self._chunk_size):
-                    sha256.update(chunk)
+            fd = os.open(file_path, os.O_RDONLY)
+            try:
+                sha256 = self._hash_fd(fd)
+            finally:
+                os.close(fd)
             
-            hash_value = sha256.hexdigest()
-            self._logger.debug(f"SHA256 hash computed for {file_path}: {hash_value}")
+            hash_value: str = sha256.hexdigest()
+            self._logger.debug("SHA256 (io_uring) hash computed for %s: %s", file_path, hash_value)
             return hash_value
             
         except IOError as e:
@@ -73,6 +409,78 @@ class SHA256HashComputer:
         return 'sha256'
 
 
+class BLAKE3HashComputer:
+    """
+    Compute BLAKE3 hashes for local files.
+    
+    Several times faster than SHA256 and able to hash a single large
+    file on multiple threads. Requires the optional ``blake3`` package.
+    
+    Thread-safe and stateless.
+    
+    Example:
+        >>> computer = BLAKE3HashComputer()
+        >>> hash_value = computer.compute_hash(Path("file.txt"))
+        >>> computer.algorithm_name
+        'blake3'
+    """
+    
+    # Files above this size are hashed with blake3's internal thread pool
+    MULTITHREADING_THRESHOLD = 1 << 20
+    
+    def __init__(self, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Initialize BLAKE3 hash computer.
+        
+        Args:
+            chunk_size: Bytes to read per iteration (default 1MB)
+        
+        Raises:
+            ImportError: If the blake3 package is not installed
+        """
+        if blake3 is None:
+            raise ImportError(
+                "BLAKE3 hashing requires the 'blake3' package (pip install blake3)"
+            )
+        self._chunk_size = chunk_size
+        self._logger = logging.getLogger(__name__)
+    
+    def compute_hash(self, file_path: Path) -> str:
+        """
+        Compute BLAKE3 hash of file contents.
+        
+        Args:
+            file_path: Path to local file
+        
+        Returns:
+            Hexadecimal BLAKE3 hash string
+        
+        Raises:
+            IOError: If file cannot be read
+        """
+        try:
+            with open(file_path, 'rb', buffering=0) as f:
+                size = os.fstat(f.fileno()).st_size
+                hasher = blake3.blake3(
+                    max_threads=blake3.blake3.AUTO
+                    if size > self.MULTITHREADING_THRESHOLD else 1
+                )
+                _update_from_file(hasher, f, self._chunk_size)
+            
+            hash_value: str = hasher.hexdigest()
+            self._logger.debug("BLAKE3 hash computed for %s: %s", file_path, hash_value)
+            return hash_value
+            
+        except IOError as e:
+            self._logger.error(f"Failed to compute BLAKE3 hash for {file_path}: {e}")
+            raise
+    
+    @property
+    def algorithm_name(self) -> str:
+        """Return algorithm name for sidecar metadata."""
+        return 'blake3'
+
+
 class MD5HashComputer:
     """
     Compute MD5 hashes for remote files via rclone.
@@ -81,7 +489,11 @@ class MD5HashComputer:
     While MD5 is cryptographically weak, it's sufficient for file integrity
     verification and is what rclone returns for most cloud providers.
     
-    Thread-safe and stateless.
+    Hashes for a whole directory can be fetched with one rclone call via
+    compute_hashes_bulk(); compute_hash() then answers from that cache
+    until the directory is fetched again or clear_cache() is called.
+    
+    Thread-safe.
     
     Example:
         >>> computer = MD5HashComputer()
@@ -90,20 +502,86 @@ class MD5HashComputer:
         'md5'
     """
     
-    def __init__(self, rclone_path: Optional[Path] = None):
+    def __init__(
+        self,
+        rclone_path: Optional[Path] = None,
+        rc_client: Optional[RcloneRCClient] = None
+    ):
         """
         Initialize MD5 hash computer.
         
         Args:
             rclone_path: Path to rclone executable (uses 'rclone' if None)
+            rc_client: Running rclone rcd client; per-file hashes are then
+                requested over rc instead of spawning rclone md5sum
         """
         self._rclone = str(rclone_path) if rclone_path else 'rclone'
+        self._rc = rc_client
         self._logger = logging.getLogger(__name__)
+        self._known_hashes: dict[str, str] = {}
+    
+    def compute_hashes_bulk(self, directory: Path, recursive: bool = True) -> dict[str, str]:
+        """
+        Fetch MD5 hashes for every file in a remote directory at once.
+        
+        Uses a single rclone lsjson call instead of one md5sum per file.
+        Results are cached and served by later compute_hash() calls; they
+        replace any hashes cached earlier for files under directory.
+        
+        Args:
+            directory: Remote directory (e.g., 'agdrive:folder')
+            recursive: Whether to include subdirectories
+        
+        Returns:
+            Mapping of remote file path to MD5 hash. Files for which the
+            backend reports no MD5 are omitted.
+        
+        Raises:
+            IOError: If rclone fails
+        """
+        # Files replaced since an earlier fetch must not keep their old hash
+        prefix = str(Path(str(directory))) + '/'
+        for path in [path for path in self._known_hashes if path.startswith(prefix)]:
+            del self._known_hashes[path]
+        
+        cmd = [self._rclone, 'lsjson', '--files-only', '--hash', '--hash-type', 'MD5']
+        if recursive:
+            cmd.append('--recursive')
+        cmd.append(str(directory))
+        
+        try:
+            # Raw bytes: the JSON parser takes them without a decode step
+            result = subprocess.run(cmd, capture_output=True, check=True)
+            entries = parse_rclone_json(result.stdout)
+        except subprocess.CalledProcessError as e:
+            error_msg = e.stderr.decode('utf-8', 'replace').strip() if e.stderr else str(e)
+            self._logger.error(f"rclone lsjson failed for {directory}: {error_msg}")
+            raise IOError(f"Failed to list MD5 hashes: {error_msg}") from e
+        except json.JSONDecodeError as e:
+            raise IOError(f"Failed to parse rclone lsjson output: {e}") from e
+        
+        # Keys built the same way as RemoteFileOperations.list_files paths
+        base = Path(str(directory))
+        hashes = {}
+        for entry in entries:
+            hash_value = (entry.get('Hashes') or {}).get('md5')
+            if hash_value:
+                hashes[str(base / entry['Path'])] = hash_value
+        
+        self._known_hashes.update(hashes)
+        self._logger.debug("Prefetched %d MD5 hashes for %s", len(hashes), directory)
+        return hashes
+    
+    def clear_cache(self) -> None:
+        """Forget all hashes fetched by compute_hashes_bulk()."""
+        self._known_hashes.clear()
     
     def compute_hash(self, file_path: Path) -> str:
         """
         Compute MD5 hash via rclone md5sum.
         
+        Served from the compute_hashes_bulk() cache when available.
+        
         Args:
             file_path: Remote path (e.g., 'agdrive:folder/file.txt')
         
@@ -113,6 +591,19 @@ class MD5HashComputer:
         Raises:
             IOError: If rclone fails or file doesn't exist
         """
+        cached = self._known_hashes.get(str(file_path))
+        if cached is not None:
+            return cached
+        
+        if self._rc is not None:
+            try:
+                hash_value = self._rc.hashsum(file_path, 'MD5')
+            except IOError as e:
+                self._logger.error(f"rclone rc hashsum failed for {file_path}: {e}")
+                raise IOError(f"Failed to compute MD5 hash: {e}") from e
+            self._logger.debug("MD5 hash computed for %s: %s", file_path, hash_value)
+            return hash_value
+        
         cmd = [self._rclone, 'md5sum', str(file_path)]
         
         try:
@@ -128,7 +619,7 @@ class MD5HashComputer:
             output = result.stdout.strip()
             if output:
                 hash_value = output.split()[0]
-                self._logger.debug(f"MD5 hash computed for {file_path}: {hash_value}")
+                self._logger.debug("MD5 hash computed for %s: %s", file_path, hash_value)
                 return hash_value
             else:
                 raise IOError(f"No MD5 hash returned for {file_path}")
@@ -150,17 +641,28 @@ class MD5HashComputer:
 # Convenience function to choose hasher based on path type
 def get_hash_computer(
     is_remote: bool,
-    rclone_path: Optional[Path] = None
-) -> SHA256HashComputer | MD5HashComputer:
+    rclone_path: Optional[Path] = None,
+    algorithm: Literal['sha256', 'blake3', 'md5'] = 'sha256',
+    use_io_uring: bool = False,
+    prefer_fastest: bool = False
+) -> (SHA256HashComputer | UringSHA256HashComputer | BLAKE3HashComputer
+      | LocalMD5HashComputer | MD5HashComputer):
     """
     Factory function to get appropriate hash computer.
     
     Args:
         is_remote: True for remote paths, False for local
         rclone_path: Path to rclone (for remote only)
+        algorithm: Algorithm for local files ('sha256', 'blake3' or 'md5').
+            Remote paths always use MD5, which is what rclone provides.
+        use_io_uring: Read local files through io_uring for SHA256 when
+            available (Linux with liburing); ignored otherwise
+        prefer_fastest: Use BLAKE3 instead of SHA256 when SHA256 is not
+            hardware-accelerated and the blake3 package is installed
     
     Returns:
-        SHA256HashComputer for local, MD5HashComputer for remote
+        SHA256HashComputer, UringSHA256HashComputer, BLAKE3HashComputer or
+        LocalMD5HashComputer for local, MD5HashComputer for remote
     
     Example:
         >>> hasher = get_hash_computer(is_remote=False)
@@ -172,5 +674,13 @@ def get_hash_computer(
     """
     if is_remote:
         return MD5HashComputer(rclone_path=rclone_path)
+    elif algorithm == 'md5':
+        return LocalMD5HashComputer()
+    elif algorithm == 'blake3' or (
+        prefer_fastest and not sha256_is_accelerated() and blake3 is not None
+    ):
+        return BLAKE3HashComputer()
+    elif use_io_uring and liburing is not None and sys.platform.startswith('linux'):
+        return UringSHA256HashComputer()
     else:
         return SHA256HashComputer()
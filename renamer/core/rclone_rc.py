@@ -0,0 +1,435 @@
+"""
+Persistent rclone remote-control (rcd) client.
+
+Runs a single `rclone rcd` server for the lifetime of a rename run and talks
+to it over its JSON-RPC HTTP API, instead of spawning one rclone process
+(and one backend login) per operation.
+"""
+
+from __future__ import annotations
+import atexit
+import base64
+import http.client
+import json
+import logging
+import os
+import secrets
+import shutil
+import socket
+import subprocess
+import tempfile
+import threading
+import time
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Optional
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None  # type: ignore[assignment]
+
+
+# Launches of rclone rcd before giving up; a retry picks a new port
+RC_START_ATTEMPTS = 3
+
+
+def parse_rclone_json(payload: bytes | str) -> Any:
+    """
+    Parse JSON printed or returned by rclone (lsjson, size --json, rc).
+    
+    Raises:
+        json.JSONDecodeError: If payload is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+def split_remote_path(path: Path | str) -> tuple[str, str]:
+    """
+    Split a remote path into rc 'fs' and 'remote' parameters.
+    
+    Example:
+        >>> split_remote_path("agdrive:folder/file.txt")
+        ('agdrive:', 'folder/file.txt')
+    """
+    fs, _, remote = str(path).partition(':')
+    return f'{fs}:', remote
+
+
+class RcloneRCClient:
+    """
+    Client for a long-lived `rclone rcd` server.
+    
+    Starts the server on a free localhost port and keeps one keep-alive
+    HTTP connection per thread. The rc API reaches every configured
+    remote, so each server gets a random user and password (handed over
+    in its environment, not its command line) and every call
+    authenticates with them. Use as a context manager so the server is
+    shut down when the run finishes; a running server is also shut down
+    at interpreter exit.
+    
+    Thread-safe.
+    
+    Example:
+        >>> with RcloneRCClient() as rc:
+        ...     rc.call('operations/hashsum', fs='agdrive:file.txt', hashType='MD5')
+    """
+    
+    def __init__(
+        self,
+        rclone_path: Optional[Path] = None,
+        startup_timeout: float = 10.0
+    ):
+        """
+        Initialize rc client (server is started by start() or __enter__).
+        
+        Args:
+            rclone_path: Path to rclone executable (uses 'rclone' if None)
+            startup_timeout: Seconds to wait for the server to accept requests
+        """
+        self._rclone = str(rclone_path) if rclone_path else 'rclone'
+        self._startup_timeout = startup_timeout
+        self._process: Optional[subprocess.Popen[bytes]] = None
+        self._port: Optional[int] = None
+        self._auth: Optional[str] = None
+        self._local = threading.local()
+        self._logger = logging.getLogger(__name__)
+    
+    @property
+    def port(self) -> Optional[int]:
+        """Port the rc server listens on (None if not started)."""
+        return self._port
+    
+    @property
+    def running(self) -> bool:
+        """Whether the rc server process is up."""
+        return self._process is not None and self._process.poll() is None
+    
+    def start(self) -> None:
+        """
+        Start the rclone rcd server and wait until it responds.
+        
+        The free port is only reserved until rclone is launched; if
+        another process binds it first rclone exits, and the server is
+        started again on a new port (up to RC_START_ATTEMPTS times).
+        
+        Raises:
+            IOError: If the server cannot be started
+        """
+        if self._process is not None:
+            return
+        
+        user, password = secrets.token_urlsafe(16), secrets.token_urlsafe(32)
+        credentials = base64.b64encode(f'{user}:{password}'.encode()).decode('ascii')
+        env = dict(os.environ, RCLONE_RC_USER=user, RCLONE_RC_PASS=password)
+        
+        for _ in range(RC_START_ATTEMPTS):
+            # Reserve a free port, then hand it to rclone
+            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+                sock.bind(('127.0.0.1', 0))
+                port = sock.getsockname()[1]
+            
+            cmd = [self._rclone, 'rcd', f'--rc-addr=127.0.0.1:{port}']
+            try:
+                self._process = subprocess.Popen(
+                    cmd,
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    env=env
+                )
+            except OSError as e:
+                raise IOError(f"Failed to start rclone rcd: {e}") from e
+            self._port = port
+            self._auth = f'Basic {credentials}'
+            
+            if self._wait_ready():
+                break
+            
+            # rclone exited, most likely because the port was taken meanwhile
+            self._process = None
+            self._port = None
+            self._auth = None
+        else:
+            raise IOError("rclone rcd did not become ready")
+        
+        atexit.register(self.close)
+        self._logger.debug("rclone rcd listening on 127.0.0.1:%d", self._port)
+    
+    def _wait_ready(self) -> bool:
+        """
+        Poll the starting server until it answers.
+        
+        Returns:
+            True once it answers, False if rclone exited first
+        
+        Raises:
+            IOError: If the server is still not answering after startup_timeout
+        """
+        assert self._process is not None
+        deadline = time.monotonic() + self._startup_timeout
+        while True:
+            try:
+                self.call('rc/noop')
+                return True
+            except IOError:
+                if self._process.poll() is not None:
+                    return False
+                if time.monotonic() > deadline:
+                    self.close()
+                    raise IOError("rclone rcd did not become ready")
+                time.sleep(0.05)
+    
+    def close(self) -> None:
+        """Shut down the rc server."""
+        if self._process is None:
+            return
+        
+        atexit.unregister(self.close)
+        try:
+            self.call('core/quit')
+        except IOError:
+            pass
+        
+        try:
+            self._process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self._process.kill()
+            self._process.wait()
+        
+        self._process = None
+        self._port = None
+        self._auth = None
+    
+    def __enter__(self) -> RcloneRCClient:
+        self.start()
+        return self
+    
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType]
+    ) -> None:
+        self.close()
+    
+    def _connection(self) -> http.client.HTTPConnection:
+        """Return this thread's keep-alive connection to the server."""
+        conn: Optional[http.client.HTTPConnection] = getattr(self._local, 'conn', None)
+        if conn is None or getattr(self._local, 'port', None) != self._port:
+            conn = http.client.HTTPConnection('127.0.0.1', self._port, timeout=None)
+            self._local.conn = conn
+            self._local.port = self._port
+        return conn
+    
+    def call(self, method: str, **params: Any) -> dict[str, Any]:
+        """
+        Call an rc method (e.g., 'operations/hashsum').
+        
+        Args:
+            method: rc method path
+            **params: JSON parameters for the method
+        
+        Returns:
+            Decoded JSON response
+        
+        Raises:
+            IOError: If the server is unreachable or the call fails
+        """
+        if self._port is None:
+            raise IOError("rclone rcd is not running")
+        
+        body = orjson.dumps(params) if orjson is not None else json.dumps(params)
+        headers = {'Content-Type': 'application/json'}
+        if self._auth is not None:
+            headers['Authorization'] = self._auth
+        conn = self._connection()
+        
+        try:
+            conn.request('POST', f'/{method}', body=body, headers=headers)
+            response = conn.getresponse()
+            data = response.read()
+        except (OSError, http.client.HTTPException) as e:
+            conn.close()
+            raise IOError(f"rclone rc {method} failed: {e}") from e
+        
+        try:
+            result: dict[str, Any] = parse_rclone_json(data) if data else {}
+        except json.JSONDecodeError as e:
+            raise IOError(f"Invalid rc response for {method}: {e}") from e
+        
+        if response.status != 200:
+            raise IOError(f"rclone rc {method} failed: {result.get('error', response.status)}")
+        
+        return result
+    
+    def hashsum(self, file_path: Path | str, hash_type: str = 'MD5') -> str:
+        """
+        Return the hash of a single remote file.
+        
+        Raises:
+            IOError: If no hash is returned
+        """
+        result = self.call('operations/hashsum', fs=str(file_path), hashType=hash_type)
+        lines = result.get('hashsum') or []
+        if not lines or not lines[0].split():
+            raise IOError(f"No {hash_type} hash returned for {file_path}")
+        hash_value: str = lines[0].split()[0]
+        return hash_value
+    
+    def read_bytes(self, file_path: Path | str) -> bytes:
+        """
+        Download a small remote file through a local temp directory.
+        
+        Raises:
+            IOError: If the file does not exist or cannot be copied
+        """
+        src_fs, src_remote = split_remote_path(file_path)
+        tmp_dir = tempfile.mkdtemp(prefix='renamer-rc-')
+        try:
+            self.call(
+                'operations/copyfile',
+                srcFs=src_fs, srcRemote=src_remote,
+                dstFs=tmp_dir, dstRemote='payload'
+            )
+            return Path(tmp_dir, 'payload').read_bytes()
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+    
+    def write_bytes(self, file_path: Path | str, data: bytes) -> None:
+        """
+        Upload bytes to a remote file through a local temp directory.
+        
+        Raises:
+            IOError: If the upload fails
+        """
+        dst_fs, dst_remote = split_remote_path(file_path)
+        tmp_dir = tempfile.mkdtemp(prefix='renamer-rc-')
+        try:
+            Path(tmp_dir, 'payload').write_bytes(data)
+            self.call(
+                'operations/copyfile',
+                srcFs=tmp_dir, srcRemote='payload',
+                dstFs=dst_fs, dstRemote=dst_remote
+            )
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+    
+    def stat(self, file_path: Path | str) -> Optional[dict[str, Any]]:
+        """
+        Return metadata of a single remote file (lsjson item format).
+        
+        Returns:
+            Item dict with 'Path', 'Name', 'Size', ..., or None if the file
+            does not exist
+        
+        Raises:
+            IOError: If the call fails
+        """
+        fs, remote = split_remote_path(file_path)
+        result = self.call('operations/stat', fs=fs, remote=remote)
+        item: Optional[dict[str, Any]] = result.get('item')
+        return item
+    
+    def list_files(self, directory: Path | str, recursive: bool = False) -> list[dict[str, Any]]:
+        """
+        List files (not directories) below a remote directory.
+        
+        Returns:
+            lsjson-style items; 'Path' is relative to the remote root
+            (e.g., 'folder/file.txt' for directory 'agdrive:folder')
+        
+        Raises:
+            IOError: If the directory cannot be listed
+        """
+        fs, remote = split_remote_path(directory)
+        result = self.call(
+            'operations/list', fs=fs, remote=remote,
+            opt={'recurse': recursive, 'filesOnly': True, 'noModTime': True, 'noMimeType': True}
+        )
+        items: list[dict[str, Any]] = result.get('list') or []
+        return items
+    
+    def copy_file(self, src_path: Path | str, dst_path: Path | str) -> None:
+        """
+        Copy a single remote file (server-side where the backend supports it).
+        
+        Raises:
+            IOError: If the copy fails
+        """
+        src_fs, src_remote = split_remote_path(src_path)
+        dst_fs, dst_remote = split_remote_path(dst_path)
+        self.call(
+            'operations/copyfile',
+            srcFs=src_fs, srcRemote=src_remote,
+            dstFs=dst_fs, dstRemote=dst_remote
+        )
+    
+    def move_file(self, src_path: Path | str, dst_path: Path | str) -> None:
+        """
+        Move a single remote file (a server-side rename where the backend
+        supports it).
+        
+        Raises:
+            IOError: If the move fails
+        """
+        src_fs, src_remote = split_remote_path(src_path)
+        dst_fs, dst_remote = split_remote_path(dst_path)
+        self.call(
+            'operations/movefile',
+            srcFs=src_fs, srcRemote=src_remote,
+            dstFs=dst_fs, dstRemote=dst_remote
+        )
+    
+    def delete_file(self, file_path: Path | str) -> None:
+        """
+        Delete a single remote file.
+        
+        Raises:
+            IOError: If the delete fails
+        """
+        fs, remote = split_remote_path(file_path)
+        self.call('operations/deletefile', fs=fs, remote=remote)
+
+
+# Process-wide rc clients, keyed by rclone executable
+_shared_clients: dict[str, RcloneRCClient] = {}
+_shared_lock = threading.Lock()
+
+
+def shared_rc_client(rclone_path: Optional[Path] = None) -> RcloneRCClient:
+    """
+    Return a running rc client shared by the whole process.
+    
+    One rclone rcd server per rclone executable is started on first use
+    and reused by later calls, so backends stay logged in (with their
+    connection pools warm) across directory runs. It is restarted if it
+    has died or been closed, and shut down at interpreter exit.
+    
+    Nothing starts it implicitly: pass the client to
+    FileRenamerFactory.create_remote_renamer() (the CLI does with --rcd).
+    
+    Args:
+        rclone_path: Path to rclone executable (uses 'rclone' if None)
+    
+    Returns:
+        Running RcloneRCClient
+    
+    Raises:
+        IOError: If the server cannot be started
+    
+    Example:
+        >>> renamer = FileRenamerFactory.create_remote_renamer(
+        ...     rc_client=shared_rc_client()
+        ... )
+    """
+    key = str(rclone_path) if rclone_path else 'rclone'
+    with _shared_lock:
+        client = _shared_clients.get(key)
+        if client is None or not client.running:
+            client = RcloneRCClient(rclone_path=rclone_path)
+            client.start()
+            _shared_clients[key] = client
+        return client
@@ -6,11 +6,12 @@ Pure functions with no side effects.
 """
 
 from __future__ import annotations
+import functools
 import re
 import hashlib
 import unicodedata
 from pathlib import Path
-from typing import Tuple
+from typing import Optional, Tuple
 
 
 # System files to exclude
@@ -36,6 +37,36 @@ TRANSLITERATION_MAP = str.maketrans({
     'ý': 'y', 'ÿ': 'y', 'ß': 'ss',
 })
 
+# Memoization size for the pure helpers: names, bases and extensions
+# repeat heavily across a directory tree
+_CACHE_SIZE = 65536
+
+# Precompiled patterns (sanitizer runs once per file)
+_RE_SAFE_EXT = re.compile(r'^\.[a-z0-9]+(\.[a-z0-9]+)?$')
+_RE_SAFE_BASE = re.compile(r'^[a-z0-9][a-z0-9_-]*[a-z0-9]$|^[a-z0-9]$')
+_RE_COLLAPSE_SEP = re.compile(r'[-_]+')
+
+
+class _BaseNameTable(dict[int, Optional[str]]):
+    """str.translate table that deletes every code point not explicitly mapped."""
+    
+    def __missing__(self, key: int) -> None:
+        self[key] = None
+        return None
+
+
+# Single-pass base name filter: transliterate, keep [a-z0-9],
+# turn separators and whitespace into '-', drop everything else
+_BASE_NAME_TABLE = _BaseNameTable(TRANSLITERATION_MAP)
+_BASE_NAME_TABLE.update({ord(c): c for c in 'abcdefghijklmnopqrstuvwxyz0123456789'})
+_BASE_NAME_TABLE.update({ord(c): '-' for c in '-_ \t\n\r'})
+
+
+@functools.lru_cache(maxsize=4096)
+def _short_hash(name: str) -> str:
+    """Return the 8-char SHA256 prefix used in collision suffixes."""
+    return hashlib.sha256(name.encode('utf-8')).hexdigest()[:8]
+
 
 class FilenameSanitizer:
     """
@@ -50,7 +81,8 @@ class FilenameSanitizer:
     - 180 character limit
     - Collision handling with --<hash> suffix
     
-    Stateless utility class.
+    Stateless utility class. Pure helpers are memoized, and sanitize()
+    results are cached per instance.
     
     Example:
         >>> sanitizer = FilenameSanitizer()
@@ -61,12 +93,20 @@ class FilenameSanitizer:
     
     MAX_FILENAME_LENGTH = 180
     
+    # Length of the '--<8-char-hash>' collision suffix
+    _SUFFIX_LEN = 10
+    
+    def __init__(self) -> None:
+        """Initialize sanitizer with its own sanitize() result cache."""
+        self._sanitize_cached = functools.lru_cache(maxsize=_CACHE_SIZE)(self._sanitize)
+    
     @staticmethod
     def is_system_file(filename: str) -> bool:
         """Check if filename is a system file to skip."""
         return filename in SYSTEM_FILES
     
     @staticmethod
+    @functools.lru_cache(maxsize=_CACHE_SIZE)
     def is_safe_filename(filename: str) -> bool:
         """
         Check if filename already meets safe naming requirements.
@@ -77,31 +117,47 @@ class FilenameSanitizer:
         Returns:
             True if filename is already safe
         """
-        # Must be lowercase
-        if filename != filename.lower():
+        # Cheap rejections first: length, then non-ASCII (isascii() is O(1)).
+        # Case needs no separate check: the patterns below only admit [a-z].
+        if len(filename) > FilenameSanitizer.MAX_FILENAME_LENGTH:
+            return False
+        if not filename.isascii():
             return False
         
         # Split into base and extension
         base, ext = FilenameSanitizer.split_filename(filename)
         
         # Extension must be lowercase alphanumeric with dot
-        if ext and not re.match(r'^\.[a-z0-9]+(\.[a-z0-9]+)?$', ext):
+        if ext and not _RE_SAFE_EXT.match(ext):
             return False
         
         # Base must be lowercase alphanumeric with hyphens/underscores
-        if not re.match(r'^[a-z0-9][a-z0-9_-]*[a-z0-9]$|^[a-z0-9]$', base):
+        if not _RE_SAFE_BASE.match(base):
             return False
         
         # No consecutive separators
         if '--' in base or '__' in base or '-_' in base or '_-' in base:
             return False
         
-        # Check length
-        if len(filename) > FilenameSanitizer.MAX_FILENAME_LENGTH:
-            return False
-        
         return True
     
+    @staticmethod
+    @functools.lru_cache(maxsize=_CACHE_SIZE)
+    def needs_rename(filename: str) -> bool:
+        """
+        Check if filename should be renamed.
+        
+        Args:
+            filename: Filename to check
+        
+        Returns:
+            True unless filename is a system file or already safe
+        """
+        return not (
+            filename in SYSTEM_FILES
+            or FilenameSanitizer.is_safe_filename(filename)
+        )
+    
     @staticmethod
     def normalize_unicode(text: str) -> str:
         """Normalize Unicode to NFKC form."""
@@ -113,6 +169,7 @@ class FilenameSanitizer:
         return text.translate(TRANSLITERATION_MAP)
     
     @staticmethod
+    @functools.lru_cache(maxsize=_CACHE_SIZE)
     def split_filename(filename: str) -> Tuple[str, str]:
         """
         Split filename into base name and extension(s).
@@ -144,6 +201,7 @@ class FilenameSanitizer:
             return filename, ''
     
     @staticmethod
+    @functools.lru_cache(maxsize=_CACHE_SIZE)
     def sanitize_base_name(name: str) -> str:
         """
         Sanitize base name (without extension) according to spec.
@@ -164,36 +222,12 @@ class FilenameSanitizer:
         # Normalize and lowercase
         name = FilenameSanitizer.normalize_unicode(name).lower()
         
-        # Transliterate
-        name = FilenameSanitizer.transliterate(name)
-        
-        # Replace whitespace and non-allowed chars with separator
-        result = []
-        prev_sep = False
-        
-        for char in name:
-            if char in 'abcdefghijklmnopqrstuvwxyz0123456789':
-                result.append(char)
-                prev_sep = False
-            elif char in '-_':
-                if not prev_sep and result:
-                    result.append('-')
-                    prev_sep = True
-            elif char in ' \t\n\r':
-                if not prev_sep and result:
-                    result.append('-')
-                    prev_sep = True
-        
-        sanitized = ''.join(result)
+        # Transliterate, map whitespace/separators to '-' and drop
+        # non-allowed chars in one C-level pass
+        sanitized = name.translate(_BASE_NAME_TABLE)
         
-        # Remove trailing separators
-        sanitized = sanitized.rstrip('-_')
-        
-        # Ensure starts with alphanumeric
-        sanitized = re.sub(r'^[^a-z0-9]+', '', sanitized)
-        
-        # Collapse consecutive separators
-        sanitized = re.sub(r'[-_]+', '-', sanitized)
+        # Collapse consecutive separators, must start/end with alphanumeric
+        sanitized = _RE_COLLAPSE_SEP.sub('-', sanitized).strip('-')
         
         # If empty, use fallback
         if not sanitized:
@@ -202,6 +236,7 @@ class FilenameSanitizer:
         return sanitized
     
     @staticmethod
+    @functools.lru_cache(maxsize=_CACHE_SIZE)
     def sanitize_extension(ext: str) -> str:
         """
         Sanitize extension (e.g., '.MP4' -> '.mp4').
@@ -268,19 +303,16 @@ class FilenameSanitizer:
         Returns:
             Filename with collision suffix
         """
-        # Generate 8-character hash from original name
-        hash_obj = hashlib.sha256(original_name.encode('utf-8'))
-        hash_suffix = hash_obj.hexdigest()[:8]
-        
         # Calculate max base length with suffix
-        suffix_part = f'--{hash_suffix}'
-        max_base_len = FilenameSanitizer.MAX_FILENAME_LENGTH - len(extension) - len(suffix_part)
+        max_base_len = (
+            FilenameSanitizer.MAX_FILENAME_LENGTH - len(extension) - FilenameSanitizer._SUFFIX_LEN
+        )
         
         # Truncate base if needed
         if len(base_name) > max_base_len:
             base_name = base_name[:max_base_len].rstrip('-_')
         
-        return f'{base_name}{suffix_part}{extension}'
+        return f'{base_name}--{_short_hash(original_name)}{extension}'
     
     def sanitize(self, filename: str) -> str:
         """
@@ -299,6 +331,10 @@ class FilenameSanitizer:
             >>> sanitizer.sanitize("My File (2023).TXT")
             'my-file-2023.txt'
         """
+        return self._sanitize_cached(filename)
+    
+    def _sanitize(self, filename: str) -> str:
+        """Uncached sanitize() implementation."""
         # Split into base and extension
         base, ext = self.split_filename(filename)
         
@@ -9,11 +9,50 @@ from __future__ import annotations
 import json
 import logging
 import subprocess
-from pathlib import Path
-from typing import Optional
+import tempfile
+import threading
+from pathlib import Path, PurePosixPath
+from typing import Any, Optional
 
 from ..domain.models import SidecarContent, FileMetadata
-from ..protocols import SidecarWriterProtocol
+from ..protocols import SidecarWriterProtocol, serialize_sidecar
+from .rclone_rc import RcloneRCClient, parse_rclone_json
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None  # type: ignore[assignment]
+
+
+# Suffix appended to a file's name to form its sidecar name
+SIDECAR_SUFFIX = '.meta.json'
+
+# Staged sidecars uploaded at once while batching, so a crash mid-run
+# loses at most this many original-name records
+SIDECAR_FLUSH_EVERY = 200
+
+
+def sidecar_path_for(file_path: Path) -> Path:
+    """
+    Return the sidecar path for a file.
+    
+    Example:
+        >>> sidecar_path_for(Path("agdrive:folder/file.txt"))
+        PosixPath('agdrive:folder/file.txt.meta.json')
+    """
+    return file_path.with_name(file_path.name + SIDECAR_SUFFIX)
+
+
+def _load_sidecar(payload: bytes) -> Any:
+    """
+    Parse raw sidecar JSON.
+    
+    Raises:
+        json.JSONDecodeError: If payload is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
 
 
 class LocalSidecarWriter:
@@ -52,13 +91,12 @@ class LocalSidecarWriter:
         Raises:
             IOError: If write fails
         """
-        sidecar_path = Path(str(file_path) + '.meta.json')
+        sidecar_path = sidecar_path_for(file_path)
         
         try:
-            with open(sidecar_path, 'w', encoding='utf-8') as f:
-                json.dump(content.to_dict(), f, indent=2, ensure_ascii=False)
+            sidecar_path.write_bytes(serialize_sidecar(content))
             
-            self._logger.debug(f"Sidecar written: {sidecar_path}")
+            self._logger.debug("Sidecar written: %s", sidecar_path)
             return sidecar_path
             
         except IOError as e:
@@ -75,30 +113,28 @@ class LocalSidecarWriter:
         Returns:
             SidecarContent if valid sidecar exists, None otherwise
         """
-        sidecar_path = Path(str(file_path) + '.meta.json')
-        
-        if not sidecar_path.exists():
-            return None
+        sidecar_path = sidecar_path_for(file_path)
         
         try:
-            with open(sidecar_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = _load_sidecar(sidecar_path.read_bytes())
             
             # Validate schema
-            if data.get('schema') != 'it.infrastructures.filemeta.v1':
+            if data.get('schema') != SidecarContent.schema:
                 self._logger.warning(f"Invalid schema in {sidecar_path}")
                 return None
             
             return SidecarContent(
-                schema=data['schema'],
                 original_filename=data.get('original_filename', ''),
                 safe_filename=data.get('safe_filename', ''),
                 file_size_bytes=data.get('file_size_bytes', 0),
                 hash=data.get('hash', ''),
                 hash_algorithm=data.get('hash_algorithm', 'sha256'),
-                renamed_at=data.get('renamed_at', '')
+                renamed_at=data.get('renamed_at', ''),
+                file_mtime_ns=data.get('file_mtime_ns')
             )
             
+        except FileNotFoundError:
+            return None
         except (IOError, json.JSONDecodeError, KeyError) as e:
             self._logger.warning(f"Failed to read sidecar {sidecar_path}: {e}")
             return None
@@ -109,7 +145,12 @@ class RcloneSidecarWriter:
     Write sidecar files to remote via rclone.
     
     Implements SidecarWriterProtocol for remote file operations.
-    Thread-safe and stateless.
+    After index_sidecars() lists a directory once, read_sidecar() skips the
+    rclone call for files known to have no sidecar, until the directory is
+    indexed again or clear_index() is called. Between begin_batch()
+    and flush_batch(), writes are staged locally and uploaded together,
+    every flush_every sidecars and at the end.
+    Thread-safe.
     
     Example:
         >>> writer = RcloneSidecarWriter()
@@ -118,15 +159,220 @@ class RcloneSidecarWriter:
         >>> sidecar_path = writer.write_sidecar(Path("agdrive:file.txt"), content)
     """
     
-    def __init__(self, rclone_path: Optional[Path] = None):
+    def __init__(
+        self,
+        rclone_path: Optional[Path] = None,
+        rc_client: Optional[RcloneRCClient] = None
+    ):
         """
         Initialize rclone sidecar writer.
         
         Args:
             rclone_path: Path to rclone executable (uses 'rclone' if None)
+            rc_client: Running rclone rcd client; sidecars are then
+                transferred over rc instead of rclone rcat/cat
         """
         self._rclone = str(rclone_path) if rclone_path else 'rclone'
+        self._rc = rc_client
         self._logger = logging.getLogger(__name__)
+        # Directories listed by index_sidecars() -> whether listing was recursive
+        self._indexed_dirs: dict[Path, bool] = {}
+        self._known_sidecars: set[str] = set()
+        # Sidecar path -> JSON payload, while batching
+        self._batch: Optional[dict[str, bytes]] = None
+        self._batch_root: Optional[Path] = None
+        self._flush_every = SIDECAR_FLUSH_EVERY
+        # Staged sidecars being uploaded by a write_sidecar() call
+        self._uploading: dict[str, bytes] = {}
+        self._batch_lock = threading.Lock()
+    
+    def index_sidecars(self, directory: Path, recursive: bool = True) -> set[str]:
+        """
+        List existing sidecars under a remote directory with one rclone call.
+        
+        Subsequent read_sidecar() calls for files in the indexed directory
+        only run rclone cat when a sidecar is actually present. Replaces any
+        earlier index covering the directory.
+        
+        Args:
+            directory: Remote directory to index
+            recursive: Whether to include subdirectories
+        
+        Returns:
+            Set of remote sidecar paths found
+        
+        Raises:
+            IOError: If rclone fails
+        """
+        self._forget_index(directory)
+        
+        cmd = [self._rclone, 'lsjson', '--files-only', '--include', '*' + SIDECAR_SUFFIX]
+        if recursive:
+            cmd.append('--recursive')
+        cmd.append(str(directory))
+        
+        try:
+            result = subprocess.run(cmd, capture_output=True, check=True)
+            entries = parse_rclone_json(result.stdout)
+        except subprocess.CalledProcessError as e:
+            error_msg = e.stderr.decode('utf-8', 'replace').strip() if e.stderr else str(e)
+            self._logger.error(f"rclone lsjson failed for {directory}: {error_msg}")
+            raise IOError(f"Failed to list sidecars: {error_msg}") from e
+        except json.JSONDecodeError as e:
+            raise IOError(f"Failed to parse rclone lsjson output: {e}") from e
+        
+        base = Path(str(directory))
+        found = {str(base / entry['Path']) for entry in entries}
+        
+        self._known_sidecars.update(found)
+        self._indexed_dirs[base] = recursive
+        self._logger.debug("Indexed %d sidecars in %s", len(found), directory)
+        return found
+    
+    def _forget_index(self, directory: Path) -> None:
+        """Drop the index covering directory, so sidecars added since count."""
+        base = Path(str(directory))
+        prefix = str(base) + '/'
+        
+        self._known_sidecars.difference_update(
+            [path for path in self._known_sidecars if path.startswith(prefix)]
+        )
+        for indexed_dir in [
+            d for d in self._indexed_dirs
+            if d == base or base in d.parents or d in base.parents
+        ]:
+            del self._indexed_dirs[indexed_dir]
+    
+    def clear_index(self) -> None:
+        """Forget all index_sidecars() results."""
+        self._known_sidecars.clear()
+        self._indexed_dirs.clear()
+    
+    def _is_indexed(self, directory: Path) -> bool:
+        """Check if directory is covered by a previous index_sidecars() call."""
+        if directory in self._indexed_dirs:
+            return True
+        return any(
+            self._indexed_dirs.get(parent, False) for parent in directory.parents
+        )
+    
+    def begin_batch(
+        self,
+        remote_root: Optional[Path] = None,
+        flush_every: int = SIDECAR_FLUSH_EVERY
+    ) -> None:
+        """
+        Stage subsequent sidecar writes until flush_batch() is called.
+        
+        Args:
+            remote_root: Remote directory the sidecars will live under;
+                when given, every flush_every staged sidecars are uploaded
+                right away instead of waiting for flush_batch()
+            flush_every: Staged sidecars per intermediate upload
+        """
+        with self._batch_lock:
+            if self._batch is None:
+                self._batch = {}
+            self._batch_root = remote_root
+            self._flush_every = flush_every
+    
+    def staged_sidecars(self) -> set[str]:
+        """Paths of the sidecars staged but not uploaded yet."""
+        with self._batch_lock:
+            return set(self._batch or ())
+    
+    def flush_batch(self, remote_root: Path) -> list[Path]:
+        """
+        Upload all staged sidecars with a single rclone copy.
+        
+        Sidecars are laid out in a local temp directory mirroring their
+        paths below remote_root, then copied in one transfer. Staged
+        sidecars outside remote_root are uploaded one by one.
+        
+        Args:
+            remote_root: Remote directory the staged sidecars live under
+        
+        Returns:
+            Paths of the sidecars uploaded by this call
+        
+        Raises:
+            IOError: If the upload fails
+        """
+        with self._batch_lock:
+            batch, self._batch = self._batch or {}, None
+            self._batch_root = None
+        return self._upload_batch(batch, remote_root)
+    
+    def _flush_staged(self, batch: dict[str, bytes], remote_root: Path) -> None:
+        """
+        Upload sidecars taken out of the batch mid-run.
+        
+        On failure they are staged again, so flush_batch() retries them
+        and reports the error.
+        """
+        try:
+            self._upload_batch(batch, remote_root)
+        except IOError as e:
+            self._logger.warning(f"Sidecar upload failed, retrying at the end: {e}")
+            with self._batch_lock:
+                if self._batch is not None:
+                    for key, payload in batch.items():
+                        self._batch.setdefault(key, payload)
+        finally:
+            with self._batch_lock:
+                for key in batch:
+                    if self._uploading.get(key) is batch[key]:
+                        del self._uploading[key]
+    
+    def _upload_batch(self, batch: dict[str, bytes], remote_root: Path) -> list[Path]:
+        """Upload staged sidecars below remote_root (see flush_batch())."""
+        if not batch:
+            return []
+        
+        root = str(remote_root)
+        prefix = root if root.endswith(':') else root + '/'
+        
+        with tempfile.TemporaryDirectory(prefix='renamer-sidecars-') as tmp_dir:
+            staged = 0
+            for sidecar_path, payload in batch.items():
+                # Below a bare "remote:" root, paths read "remote:/name"
+                relative = PurePosixPath(sidecar_path[len(prefix):].lstrip('/'))
+                if (
+                    not sidecar_path.startswith(prefix)
+                    or not relative.parts
+                    or '..' in relative.parts
+                ):
+                    self._upload(Path(sidecar_path), payload)
+                    continue
+                local_path = Path(tmp_dir, *relative.parts)
+                local_path.parent.mkdir(parents=True, exist_ok=True)
+                local_path.write_bytes(payload)
+                staged += 1
+            
+            if staged:
+                self._copy_tree(tmp_dir, root)
+        
+        self._logger.debug("Uploaded %d sidecars to %s", len(batch), root)
+        return [Path(sidecar_path) for sidecar_path in batch]
+    
+    def _copy_tree(self, local_dir: str, remote_root: str) -> None:
+        """Copy a local directory tree onto a remote directory."""
+        if self._rc is not None:
+            try:
+                self._rc.call('sync/copy', srcFs=local_dir, dstFs=remote_root)
+            except IOError as e:
+                self._logger.error(f"rclone rc copy failed for {remote_root}: {e}")
+                raise IOError(f"Failed to write sidecars: {e}") from e
+            return
+        
+        cmd = [self._rclone, 'copy', '--transfers=32', '--checksum', local_dir, remote_root]
+        
+        try:
+            subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=True)
+        except subprocess.CalledProcessError as e:
+            error_msg = e.stderr.decode('utf-8', 'replace').strip() if e.stderr else str(e)
+            self._logger.error(f"rclone copy failed for {remote_root}: {error_msg}")
+            raise IOError(f"Failed to write sidecars: {error_msg}") from e
     
     def write_sidecar(
         self,
@@ -136,6 +382,8 @@ class RcloneSidecarWriter:
         """
         Write sidecar .meta.json via rclone rcat.
         
+        While batching, the sidecar is only staged; see flush_batch().
+        
         Args:
             file_path: Remote path to renamed file
             content: Sidecar content to write
@@ -146,26 +394,63 @@ class RcloneSidecarWriter:
         Raises:
             IOError: If rclone write fails
         """
-        sidecar_path = Path(str(file_path) + '.meta.json')
-        json_content = json.dumps(content.to_dict(), indent=2, ensure_ascii=False)
+        sidecar_path = sidecar_path_for(file_path)
+        payload = serialize_sidecar(content)
+        
+        if self._batch is not None:
+            key = str(sidecar_path)
+            full: Optional[dict[str, bytes]] = None
+            with self._batch_lock:
+                batch = self._batch
+                if batch is not None:
+                    batch[key] = payload
+                    self._known_sidecars.add(key)
+                    root = self._batch_root
+                    if root is not None and len(batch) >= self._flush_every:
+                        full, self._batch = batch, {}
+                        self._uploading.update(full)
+            if batch is not None:
+                self._logger.debug("Sidecar staged: %s", sidecar_path)
+                if full is not None and root is not None:
+                    self._flush_staged(full, root)
+                return sidecar_path
+        
+        self._upload(sidecar_path, payload)
+        return sidecar_path
+    
+    def _upload(self, sidecar_path: Path, payload: bytes) -> None:
+        """
+        Upload one sidecar via rclone rc or rclone rcat.
+        
+        Raises:
+            IOError: If rclone write fails
+        """
+        if self._rc is not None:
+            try:
+                self._rc.write_bytes(sidecar_path, payload)
+            except IOError as e:
+                self._logger.error(f"rclone rc upload failed for {sidecar_path}: {e}")
+                raise IOError(f"Failed to write sidecar: {e}") from e
+            self._known_sidecars.add(str(sidecar_path))
+            self._logger.debug("Sidecar written via rclone rc: %s", sidecar_path)
+            return
         
         cmd = [self._rclone, 'rcat', str(sidecar_path)]
         
         try:
-            result = subprocess.run(
+            subprocess.run(
                 cmd,
-                input=json_content,
-                capture_output=True,
-                text=True,
-                encoding='utf-8',
+                input=payload,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 check=True
             )
             
-            self._logger.debug(f"Sidecar written via rclone: {sidecar_path}")
-            return sidecar_path
+            self._known_sidecars.add(str(sidecar_path))
+            self._logger.debug("Sidecar written via rclone: %s", sidecar_path)
             
         except subprocess.CalledProcessError as e:
-            error_msg = e.stderr.strip() if e.stderr else str(e)
+            error_msg = e.stderr.decode('utf-8', 'replace').strip() if e.stderr else str(e)
             self._logger.error(f"rclone rcat failed for {sidecar_path}: {error_msg}")
             raise IOError(f"Failed to write sidecar: {error_msg}") from e
     
@@ -179,36 +464,44 @@ class RcloneSidecarWriter:
         Returns:
             SidecarContent if valid sidecar exists, None otherwise
         """
-        sidecar_path = Path(str(file_path) + '.meta.json')
-        cmd = [self._rclone, 'cat', str(sidecar_path)]
+        sidecar_path = sidecar_path_for(file_path)
+        key = str(sidecar_path)
+        
+        if key not in self._known_sidecars and self._is_indexed(sidecar_path.parent):
+            return None
+        
+        with self._batch_lock:
+            staged = (self._batch or {}).get(key) or self._uploading.get(key)
         
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                encoding='utf-8',
-                check=True
-            )
-            
-            data = json.loads(result.stdout)
+            if staged is not None:
+                data = _load_sidecar(staged)
+            elif self._rc is not None:
+                data = _load_sidecar(self._rc.read_bytes(sidecar_path))
+            else:
+                result = subprocess.run(
+                    [self._rclone, 'cat', str(sidecar_path)],
+                    capture_output=True,
+                    check=True
+                )
+                data = _load_sidecar(result.stdout)
             
             # Validate schema
-            if data.get('schema') != 'it.infrastructures.filemeta.v1':
+            if data.get('schema') != SidecarContent.schema:
                 self._logger.warning(f"Invalid schema in {sidecar_path}")
                 return None
             
             return SidecarContent(
-                schema=data['schema'],
                 original_filename=data.get('original_filename', ''),
                 safe_filename=data.get('safe_filename', ''),
                 file_size_bytes=data.get('file_size_bytes', 0),
                 hash=data.get('hash', ''),
                 hash_algorithm=data.get('hash_algorithm', 'md5'),
-                renamed_at=data.get('renamed_at', '')
+                renamed_at=data.get('renamed_at', ''),
+                file_mtime_ns=data.get('file_mtime_ns')
             )
             
-        except (subprocess.CalledProcessError, json.JSONDecodeError, KeyError) as e:
+        except (IOError, subprocess.CalledProcessError, json.JSONDecodeError, KeyError) as e:
             # File doesn't exist or invalid JSON
             return None
 
@@ -9,19 +9,23 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import ClassVar, Optional
+import time
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OperationTiming:
     """
     Value object representing timing information for an operation.
     
-    Immutable and self-contained.
+    Immutable and self-contained. Timings created by start_now() also
+    carry perf_counter() readings, used for a monotonic duration.
     
     Attributes:
         start: Operation start timestamp
         end: Operation end timestamp
+        start_counter: time.perf_counter() at start (0.0 if unknown)
+        end_counter: time.perf_counter() at end (0.0 if unknown)
     
     Example:
         >>> timing = OperationTiming(
@@ -33,29 +37,41 @@ class OperationTiming:
     """
     start: datetime
     end: datetime
+    start_counter: float = field(default=0.0, repr=False)
+    end_counter: float = field(default=0.0, repr=False)
     
     @property
     def duration_seconds(self) -> float:
         """Calculate operation duration in seconds."""
+        if self.start_counter and self.end_counter:
+            return self.end_counter - self.start_counter
         return (self.end - self.start).total_seconds()
     
     @staticmethod
     def start_now() -> OperationTiming:
         """Create timing starting now (end will be same as start initially)."""
         now = datetime.now()
-        return OperationTiming(start=now, end=now)
+        counter = time.perf_counter()
+        return OperationTiming(start=now, end=now, start_counter=counter, end_counter=counter)
     
     def finish_now(self) -> OperationTiming:
         """Return new timing with end set to current time."""
-        return OperationTiming(start=self.start, end=datetime.now())
+        return OperationTiming(
+            start=self.start,
+            end=datetime.now(),
+            start_counter=self.start_counter,
+            end_counter=time.perf_counter()
+        )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OperationStats:
     """
     Statistics for a batch rename operation.
     
     Immutable value object for tracking operation metrics.
+    The increment_*() helpers allocate a new instance per call; batch
+    code should tally counts first and construct once.
     
     Attributes:
         total_files: Total files encountered
@@ -117,7 +133,7 @@ class OperationStats:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FileMetadata:
     """
     Metadata about a file for sidecar JSON generation.
@@ -129,23 +145,28 @@ class FileMetadata:
         safe_name: Sanitized filename
         size_bytes: File size in bytes
         hash_value: File content hash
-        hash_algorithm: Algorithm used for hash ('sha256' or 'md5')
+        hash_algorithm: Algorithm used for hash ('sha256', 'blake3' or 'md5')
         timestamp: ISO format timestamp of metadata generation
+        mtime_ns: File modification time in nanoseconds (None if unknown)
     """
     original_name: str
     safe_name: str
     size_bytes: int
     hash_value: str
-    hash_algorithm: str  # 'sha256' or 'md5'
+    hash_algorithm: str  # 'sha256', 'blake3' or 'md5'
     timestamp: str  # ISO format
+    mtime_ns: Optional[int] = None
     
     def __post_init__(self):
         """Validate hash algorithm."""
-        if self.hash_algorithm not in ('sha256', 'md5'):
-            raise ValueError(f"Invalid hash algorithm: {self.hash_algorithm}. Must be 'sha256' or 'md5'")
+        if self.hash_algorithm not in ('sha256', 'blake3', 'md5'):
+            raise ValueError(
+                f"Invalid hash algorithm: {self.hash_algorithm}. "
+                f"Must be 'sha256', 'blake3' or 'md5'"
+            )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SidecarContent:
     """
     Content for .meta.json sidecar file.
@@ -153,21 +174,23 @@ class SidecarContent:
     Immutable structure following it.infrastructures.filemeta.v1 schema.
     
     Attributes:
-        schema: Schema identifier
+        schema: Schema identifier (class-level; the same for every sidecar)
         original_filename: Original filename
         safe_filename: Sanitized filename
         file_size_bytes: File size
         hash: File content hash
         hash_algorithm: Hash algorithm used
         renamed_at: ISO timestamp
+        file_mtime_ns: File modification time when hashed (optional)
     """
-    schema: str = "it.infrastructures.filemeta.v1"
+    schema: ClassVar[str] = "it.infrastructures.filemeta.v1"
     original_filename: str = ""
     safe_filename: str = ""
     file_size_bytes: int = 0
     hash: str = ""
     hash_algorithm: str = "sha256"
     renamed_at: str = ""
+    file_mtime_ns: Optional[int] = None
     
     @staticmethod
     def from_metadata(metadata: FileMetadata) -> SidecarContent:
@@ -178,12 +201,36 @@ class SidecarContent:
             file_size_bytes=metadata.size_bytes,
             hash=metadata.hash_value,
             hash_algorithm=metadata.hash_algorithm,
-            renamed_at=metadata.timestamp
+            renamed_at=metadata.timestamp,
+            file_mtime_ns=metadata.mtime_ns
+        )
+    
+    def describes(self, size_bytes: int, mtime_ns: Optional[int], hash_algorithm: str) -> bool:
+        """
+        Check if the recorded hash still describes the file's current state.
+        
+        Requires a recorded modification time: size alone does not detect
+        in-place edits.
+        
+        Args:
+            size_bytes: Current file size
+            mtime_ns: Current modification time in nanoseconds
+            hash_algorithm: Algorithm the caller would hash with
+        
+        Returns:
+            True if the stored hash can be reused instead of rehashing
+        """
+        return (
+            bool(self.hash)
+            and self.file_mtime_ns is not None
+            and self.file_mtime_ns == mtime_ns
+            and self.file_size_bytes == size_bytes
+            and self.hash_algorithm == hash_algorithm
         )
     
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
-        return {
+        data = {
             "schema": self.schema,
             "original_filename": self.original_filename,
             "safe_filename": self.safe_filename,
@@ -192,8 +239,13 @@ class SidecarContent:
             "hash_algorithm": self.hash_algorithm,
             "renamed_at": self.renamed_at
         }
+        if self.file_mtime_ns is not None:
+            data["file_mtime_ns"] = self.file_mtime_ns
+        return data
 
 
+# No slots: the success()/skipped() factories share names with fields,
+# which __slots__ does not allow
 @dataclass(frozen=True)
 class RenameResult:
     """
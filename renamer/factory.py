@@ -7,22 +7,67 @@ Follows Factory pattern and Dependency Injection principle.
 
 from __future__ import annotations
 from pathlib import Path
-from typing import Optional
+from typing import Literal, Optional
+import functools
 import re
 
 from .domain.models import OperationStats
-from .protocols import FileRenamerProtocol
-from .core.hash_strategy import SHA256HashComputer, MD5HashComputer
+from .protocols import FileRenamerProtocol, HashComputerProtocol
+from .core.hash_strategy import (
+    MD5HashComputer,
+    SHA256HashComputer,
+    UringSHA256HashComputer,
+    get_hash_computer,
+    sha256_is_accelerated
+)
 from .core.sidecar import (
     LocalSidecarWriter,
     RcloneSidecarWriter,
     SidecarManager
 )
 from .core.sanitizer import FilenameSanitizer
+from .core.rclone_rc import RcloneRCClient
 from .operations.local import LocalFileRenamer, LocalFileOperations
 from .operations.remote import RemoteFileRenamer, RemoteFileOperations
 
 
+# Pattern: word characters followed by colon, NOT followed by a slash
+# Matches: "agdrive:", "s3:", "dropbox:"
+# Excludes: "C:\", "D:/"
+_REMOTE_PATH_RE = re.compile(r'^[a-zA-Z][\w-]*:(?![\\\/])')
+
+
+@functools.lru_cache(maxsize=None)
+def _default_sanitizer() -> FilenameSanitizer:
+    """Sanitizer shared by renamers created without a custom one."""
+    return FilenameSanitizer()
+
+
+@functools.lru_cache(maxsize=None)
+def _local_components(
+    hash_algorithm: Literal['sha256', 'blake3', 'md5'] = 'sha256',
+    use_io_uring: bool = False,
+    prefer_fastest: bool = False
+) -> tuple[HashComputerProtocol, LocalSidecarWriter, LocalFileOperations]:
+    """
+    Stateless local dependencies, created on first use and then shared.
+    
+    All three are thread-safe and keep no per-run state, so every local
+    renamer with the same hash options can use the same instances. The
+    hasher comes from get_hash_computer(); when it is SHA256, the speed
+    probe runs once so a slow SHA256 is reported.
+    """
+    hasher = get_hash_computer(
+        is_remote=False,
+        algorithm=hash_algorithm,
+        use_io_uring=use_io_uring,
+        prefer_fastest=prefer_fastest
+    )
+    if isinstance(hasher, (SHA256HashComputer, UringSHA256HashComputer)):
+        sha256_is_accelerated()
+    return hasher, LocalSidecarWriter(), LocalFileOperations()
+
+
 class FileRenamerFactory:
     """
     Factory for creating FileRenamer instances.
@@ -71,30 +116,39 @@ class FileRenamerFactory:
         """
         path_str = str(path)
         
-        # Pattern: word characters followed by colon, NOT followed by backslash
-        # Matches: "agdrive:", "s3:", "dropbox:"
-        # Excludes: "C:\", "D:\"
-        remote_pattern = r'^[a-zA-Z][\w-]*:(?![\\\/])'
+        # Plain POSIX and UNC paths have no colon: skip the regex
+        if ':' not in path_str:
+            return False
         
-        return bool(re.match(remote_pattern, path_str))
+        return _REMOTE_PATH_RE.match(path_str) is not None
     
     @staticmethod
     def create_local_renamer(
         verbose: bool = False,
-        sanitizer: Optional[FilenameSanitizer] = None
+        sanitizer: Optional[FilenameSanitizer] = None,
+        hash_algorithm: Literal['sha256', 'blake3', 'md5'] = 'sha256',
+        use_io_uring: bool = False,
+        prefer_fastest: bool = False
     ) -> LocalFileRenamer:
         """
         Create renamer for local filesystem.
         
         Wires up:
-        - SHA256HashComputer (recommended for local)
+        - Hash computer from get_hash_computer() (SHA256 by default,
+          recommended for local)
         - LocalSidecarWriter
         - LocalFileOperations
         - FilenameSanitizer
         
         Args:
             verbose: Enable verbose logging
-            sanitizer: Custom sanitizer (creates default if None)
+            sanitizer: Custom sanitizer (shared default if None)
+            hash_algorithm: 'sha256', 'blake3' (needs the blake3 package)
+                or 'md5'
+            use_io_uring: Read files through io_uring for SHA256 when
+                available (Linux with liburing)
+            prefer_fastest: Use BLAKE3 when SHA256 is not
+                hardware-accelerated and blake3 is installed
         
         Returns:
             Configured LocalFileRenamer instance
@@ -103,11 +157,11 @@ class FileRenamerFactory:
             >>> renamer = FileRenamerFactory.create_local_renamer(verbose=True)
             >>> result = renamer.rename_file(Path("My File.TXT"))
         """
-        # Create dependencies
-        hasher = SHA256HashComputer()
-        sidecar_writer = LocalSidecarWriter()
-        file_ops = LocalFileOperations()
-        sanitizer = sanitizer or FilenameSanitizer()
+        # Shared dependencies (all stateless)
+        hasher, sidecar_writer, file_ops = _local_components(
+            hash_algorithm, use_io_uring, prefer_fastest
+        )
+        sanitizer = sanitizer or _default_sanitizer()
         
         # Wire up renamer with dependency injection
         return LocalFileRenamer(
@@ -122,7 +176,8 @@ class FileRenamerFactory:
     def create_remote_renamer(
         rclone_path: Optional[Path] = None,
         verbose: bool = False,
-        sanitizer: Optional[FilenameSanitizer] = None
+        sanitizer: Optional[FilenameSanitizer] = None,
+        rc_client: Optional[RcloneRCClient] = None
     ) -> RemoteFileRenamer:
         """
         Create renamer for remote filesystem via rclone.
@@ -136,7 +191,10 @@ class FileRenamerFactory:
         Args:
             rclone_path: Path to rclone executable (uses 'rclone' if None)
             verbose: Enable verbose logging
-            sanitizer: Custom sanitizer (creates default if None)
+            sanitizer: Custom sanitizer (shared default if None)
+            rc_client: Running rclone rcd client shared by hasher,
+                sidecar writer, file operations and renames (caller owns
+                its lifetime)
         
         Returns:
             Configured RemoteFileRenamer instance
@@ -146,10 +204,10 @@ class FileRenamerFactory:
             >>> result = renamer.rename_file(Path("agdrive:folder/My File.TXT"))
         """
         # Create dependencies
-        hasher = MD5HashComputer(rclone_path=rclone_path)
-        sidecar_writer = RcloneSidecarWriter(rclone_path=rclone_path)
-        file_ops = RemoteFileOperations(rclone_path=rclone_path)
-        sanitizer = sanitizer or FilenameSanitizer()
+        hasher = MD5HashComputer(rclone_path=rclone_path, rc_client=rc_client)
+        sidecar_writer = RcloneSidecarWriter(rclone_path=rclone_path, rc_client=rc_client)
+        file_ops = RemoteFileOperations(rclone_path=rclone_path, rc_client=rc_client)
+        sanitizer = sanitizer or _default_sanitizer()
         
         # Wire up renamer with dependency injection
         return RemoteFileRenamer(
@@ -166,7 +224,11 @@ class FileRenamerFactory:
         path: Path | str,
         rclone_path: Optional[Path] = None,
         verbose: bool = False,
-        sanitizer: Optional[FilenameSanitizer] = None
+        sanitizer: Optional[FilenameSanitizer] = None,
+        rc_client: Optional[RcloneRCClient] = None,
+        hash_algorithm: Literal['sha256', 'blake3', 'md5'] = 'sha256',
+        use_io_uring: bool = False,
+        prefer_fastest: bool = False
     ) -> FileRenamerProtocol:
         """
         Create renamer by auto-detecting path type.
@@ -177,7 +239,12 @@ class FileRenamerFactory:
             path: Path to analyze (local or remote)
             rclone_path: Path to rclone executable (for remote only)
             verbose: Enable verbose logging
-            sanitizer: Custom sanitizer (creates default if None)
+            sanitizer: Custom sanitizer (shared default if None)
+            rc_client: Running rclone rcd client (for remote only)
+            hash_algorithm: Local hash algorithm (for local only; remote
+                paths use MD5)
+            use_io_uring: Read through io_uring (for local only)
+            prefer_fastest: Prefer BLAKE3 over slow SHA256 (for local only)
         
         Returns:
             LocalFileRenamer or RemoteFileRenamer based on path type
@@ -199,12 +266,16 @@ class FileRenamerFactory:
             return FileRenamerFactory.create_remote_renamer(
                 rclone_path=rclone_path,
                 verbose=verbose,
-                sanitizer=sanitizer
+                sanitizer=sanitizer,
+                rc_client=rc_client
             )
         else:
             return FileRenamerFactory.create_local_renamer(
                 verbose=verbose,
-                sanitizer=sanitizer
+                sanitizer=sanitizer,
+                hash_algorithm=hash_algorithm,
+                use_io_uring=use_io_uring,
+                prefer_fastest=prefer_fastest
             )
 
 
@@ -7,10 +7,13 @@ implementing filesystem-specific operations.
 
 from __future__ import annotations
 from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import Any, Callable, Optional
 import logging
+import os
+import threading
 
 from ..domain.models import (
     RenameResult,
@@ -24,6 +27,21 @@ from ..protocols import (
     FileOperationsProtocol
 )
 from ..core.sanitizer import FilenameSanitizer
+from ..core.sidecar import SIDECAR_SUFFIX, sidecar_path_for
+
+
+# Renames are dominated by disk reads (hashing), syscalls and rclone
+# round trips, all of which release the GIL, so threads scale well
+# past the core count
+DEFAULT_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Renames submitted ahead of the workers, per worker; bounds how much of
+# the listing is turned into pending renames at once
+QUEUED_RENAMES_PER_WORKER = 4
+
+
+def _discard(message: str, *args: object) -> None:
+    """Drop a verbose message (verbose mode disabled)."""
 
 
 class BaseFileRenamer(ABC):
@@ -51,6 +69,19 @@ class BaseFileRenamer(ABC):
         >>> result = renamer.rename_file(Path("file.txt"))
     """
     
+    # Attributes are read on every rename_file() call; slots make those
+    # reads offset loads instead of dict lookups
+    __slots__ = (
+        '_hasher', '_sidecar_writer', '_file_ops', '_sanitizer', '_verbose', '_log_verbose'
+    )
+    
+    # One logger per subclass, named after it (set by __init_subclass__)
+    _logger: logging.Logger
+    
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._logger = logging.getLogger(cls.__name__)
+    
     def __init__(
         self,
         hasher: HashComputerProtocol,
@@ -74,7 +105,12 @@ class BaseFileRenamer(ABC):
         self._file_ops = file_operations
         self._sanitizer = sanitizer or FilenameSanitizer()
         self._verbose = verbose
-        self._logger = logging.getLogger(self.__class__.__name__)
+        
+        # Log message if verbose mode enabled; bound once so quiet runs
+        # skip the verbose check on every call
+        self._log_verbose: Callable[..., None] = (
+            self._logger.debug if verbose else _discard
+        )
         
         if verbose:
             self._logger.setLevel(logging.DEBUG)
@@ -82,7 +118,8 @@ class BaseFileRenamer(ABC):
     def rename_file(
         self,
         file_path: Path,
-        dry_run: bool = False
+        dry_run: bool = False,
+        timestamp: Optional[str] = None
     ) -> RenameResult:
         """
         Rename a single file to safe name (Template Method).
@@ -92,90 +129,79 @@ class BaseFileRenamer(ABC):
         2. Check if already safe -> skip
         3. Sanitize filename
         4. Handle collision (check sidecar)
-        5. Perform rename (delegated to subclass)
-        6. Compute hash
+        5. Compute hash and stat (content is unchanged by the rename)
+        6. Perform rename (delegated to subclass); on an existing
+           target, handle the collision and retry
         7. Write sidecar
         
         Args:
             file_path: Path to file to rename
             dry_run: If True, simulate without actual rename
+            timestamp: ISO timestamp for the sidecar (default: now)
         
         Returns:
             RenameResult with operation outcome
         """
+        # Resolved once: each is used several times below
+        sanitizer = self._sanitizer
+        hasher = self._hasher
+        log_verbose = self._log_verbose
+        
         try:
             filename = file_path.name
             
             # Step 1: Skip system files
-            if self._sanitizer.is_system_file(filename):
-                self._log_verbose(f"Skipping system file: {filename}")
+            if sanitizer.is_system_file(filename):
+                log_verbose("Skipping system file: %s", filename)
                 return RenameResult.skipped(file_path, "System file")
             
             # Step 2: Check if already safe
-            if self._sanitizer.is_safe_filename(filename):
-                self._log_verbose(f"Already safe: {filename}")
+            if sanitizer.is_safe_filename(filename):
+                log_verbose("Already safe: %s", filename)
                 return RenameResult.skipped(file_path, "Already safe")
             
             # Step 3: Sanitize filename
-            safe_name = self._sanitizer.sanitize(filename)
-            self._log_verbose(f"Sanitized: {filename} -> {safe_name}")
+            safe_name = sanitizer.sanitize(filename)
+            log_verbose("Sanitized: %s -> %s", filename, safe_name)
             
-            # Step 4: Handle collision
-            parent = file_path.parent
-            new_path = parent / safe_name
-            
-            if self._file_ops.file_exists(new_path):
-                # Possible collision - verify if it's the same file
-                is_same_file = False
-                
-                # Quick check 1: Compare resolved paths (works on case-insensitive FS)
-                try:
-                    is_same_file = file_path.resolve() == new_path.resolve()
-                except Exception as e:
-                    self._log_verbose(f"Path resolution failed: {e}")
-                
-                # Check 2: Compare file hashes for certainty (works on case-sensitive FS)
-                if not is_same_file:
-                    try:
-                        old_hash = self._hasher.compute_hash(file_path)
-                        new_hash = self._hasher.compute_hash(new_path)
-                        is_same_file = (old_hash == new_hash)
-                        self._log_verbose(f"Hash comparison: same={is_same_file}")
-                    except Exception as e:
-                        self._log_verbose(f"Hash comparison failed: {e}")
-                
-                if is_same_file:
-                    # Same file (case change only) - proceed with rename
-                    self._log_verbose(f"Same file detected, case change only: {filename} -> {safe_name}")
-                else:
-                    # Different file exists - check if already renamed via sidecar
-                    existing_sidecar = self._sidecar_writer.read_sidecar(new_path)
-                    if existing_sidecar and existing_sidecar.original_filename == filename:
-                        self._log_verbose(f"File already renamed previously: {filename}")
-                        return RenameResult.skipped(file_path, "Already renamed")
-                    
-                    # True collision - add hash suffix
-                    base, ext = self._sanitizer.split_filename(safe_name)
-                    safe_name = self._sanitizer.add_collision_suffix(base, ext, filename)
-                    new_path = parent / safe_name
-                    self._log_verbose(f"Collision detected, suffix added: {safe_name}")
+            # Step 4: Handle collision (dry run only; real renames detect
+            # an existing target when the rename itself fails, in step 6)
+            new_path = file_path.parent / safe_name
             
             # Dry run - stop here
             if dry_run:
-                self._log_verbose(f"[DRY RUN] Would rename: {filename} -> {safe_name}")
+                if self._file_ops.file_exists(new_path):
+                    target, _ = self._resolve_collision(file_path, new_path, None)
+                    if target is None:
+                        return RenameResult.skipped(file_path, "Already renamed")
+                    new_path, safe_name = target, target.name
+                log_verbose("[DRY RUN] Would rename: %s -> %s", filename, safe_name)
                 return RenameResult.success(
                     original_path=file_path,
                     new_path=new_path,
-                    sidecar_path=Path(str(new_path) + '.meta.json')
+                    sidecar_path=sidecar_path_for(new_path)
                 )
             
-            # Step 5: Perform actual rename (delegated to subclass)
-            self._perform_rename(file_path, new_path)
-            self._log_verbose(f"Renamed: {file_path} -> {new_path}")
+            # Step 5: Compute hash of the original path, so hashers that
+            # prefetched a directory listing can answer from it. Size and
+            # mtime survive the rename, so they are read here too, while
+            # the file is still hot
+            file_hash = hasher.compute_hash(file_path)
+            file_size, mtime_ns = self._get_file_stat(file_path)
             
-            # Step 6: Compute hash
-            file_hash = self._hasher.compute_hash(new_path)
-            file_size = self._get_file_size(new_path)
+            # Step 6: Perform actual rename (delegated to subclass). Most
+            # targets are free, so try first and only check for a
+            # collision when the target turns out to exist
+            try:
+                self._perform_rename_exclusive(file_path, new_path)
+            except FileExistsError:
+                # file_hash is already known, so it comes back unchanged
+                target, _ = self._resolve_collision(file_path, new_path, file_hash)
+                if target is None:
+                    return RenameResult.skipped(file_path, "Already renamed")
+                new_path, safe_name = target, target.name
+                self._perform_rename(file_path, new_path)
+            log_verbose("Renamed: %s -> %s", file_path, new_path)
             
             # Step 7: Write sidecar
             metadata = FileMetadata(
@@ -183,14 +209,15 @@ class BaseFileRenamer(ABC):
                 safe_name=safe_name,
                 size_bytes=file_size,
                 hash_value=file_hash,
-                hash_algorithm=self._hasher.algorithm_name,
-                timestamp=datetime.now().isoformat()
+                hash_algorithm=hasher.algorithm_name,
+                timestamp=timestamp or datetime.now().isoformat(),
+                mtime_ns=mtime_ns
             )
             
             sidecar_content = SidecarContent.from_metadata(metadata)
             sidecar_path = self._sidecar_writer.write_sidecar(new_path, sidecar_content)
             
-            self._log_verbose(f"Sidecar written: {sidecar_path}")
+            log_verbose("Sidecar written: %s", sidecar_path)
             
             return RenameResult.success(
                 original_path=file_path,
@@ -206,33 +233,180 @@ class BaseFileRenamer(ABC):
         self,
         directory: Path,
         recursive: bool = True,
-        dry_run: bool = False
+        dry_run: bool = False,
+        max_workers: Optional[int] = None,
+        precise_timestamps: bool = False
     ) -> list[RenameResult]:
         """
         Rename all files in directory.
         
+        Files are renamed on a thread pool while the listing is still being
+        consumed, with at most QUEUED_RENAMES_PER_WORKER renames per worker
+        pending at a time. A rename waits only for earlier renames it may
+        conflict with (see _conflict_names()), so results are the same as
+        for a sequential run. If the listing fails part way, the results of
+        the files listed until then are still returned.
+        
         Args:
             directory: Directory to process
             recursive: Whether to recurse into subdirectories
             dry_run: If True, simulate without actual rename
+            max_workers: Worker threads (default DEFAULT_MAX_WORKERS;
+                1 processes files sequentially on the calling thread)
+            precise_timestamps: Stamp each sidecar with its own rename time
+                instead of one timestamp for the whole run
         
         Returns:
-            List of RenameResult for each file processed
+            List of RenameResult for each file processed, in listing order
         """
-        results = []
+        results: list[RenameResult] = []
+        timestamp = None if precise_timestamps else datetime.now().isoformat()
         
         try:
             files = self._file_ops.list_files(directory, recursive=recursive)
+            workers = max_workers or DEFAULT_MAX_WORKERS
             
-            for file_path in files:
-                result = self.rename_file(file_path, dry_run=dry_run)
-                results.append(result)
+            if workers == 1:
+                rename_file = self.rename_file
+                append = results.append
+                for file_path in files:
+                    append(rename_file(file_path, dry_run, timestamp))
+                return results
+            
+            futures: list[Future[RenameResult]] = []
+            try:
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    # Latest rename that touches each (directory, name)
+                    last_touch: dict[tuple[Path, str], Future[RenameResult]] = {}
+                    conflict_names = self._conflict_names
+                    submit = pool.submit
+                    rename_after = self._rename_after
+                    pending = threading.Semaphore(workers * QUEUED_RENAMES_PER_WORKER)
+                    acquire = pending.acquire
+                    
+                    def release(_: Future[RenameResult]) -> None:
+                        pending.release()
+                    
+                    for file_path in files:
+                        parent = file_path.parent
+                        keys = [(parent, name) for name in conflict_names(file_path.name)]
+                        after = {last_touch[key] for key in keys if key in last_touch}
+                        # Renames only wait on earlier ones, which keep
+                        # finishing and releasing slots while this blocks
+                        acquire()
+                        future = submit(rename_after, after, file_path, dry_run, timestamp)
+                        future.add_done_callback(release)
+                        for key in keys:
+                            last_touch[key] = future
+                        futures.append(future)
+            finally:
+                # The pool has finished every submitted rename by now
+                results = [future.result() for future in futures]
             
         except Exception as e:
             self._logger.error(f"Failed to process directory {directory}: {e}")
         
         return results
     
+    def _resolve_collision(
+        self,
+        file_path: Path,
+        new_path: Path,
+        file_hash: Optional[str]
+    ) -> tuple[Optional[Path], Optional[str]]:
+        """
+        Decide where a file goes when its sanitized name already exists.
+        
+        Args:
+            file_path: File being renamed
+            new_path: Existing file at the sanitized name
+            file_hash: Hash of file_path if already computed
+        
+        Returns:
+            (target path, hash of file_path if computed). The target is
+            new_path for a case-only change of the same file, a
+            hash-suffixed path for a true collision, or None if the file
+            was already renamed in an earlier run.
+        """
+        filename = file_path.name
+        log_verbose = self._log_verbose
+        is_same_file = False
+        
+        # Quick check 1: Compare resolved paths (works on case-insensitive FS)
+        try:
+            is_same_file = file_path.resolve() == new_path.resolve()
+        except Exception as e:
+            log_verbose("Path resolution failed: %s", e)
+        
+        # Check 2: Compare file hashes for certainty (works on case-sensitive FS)
+        existing_sidecar = None
+        if not is_same_file:
+            existing_sidecar = self._sidecar_writer.read_sidecar(new_path)
+            try:
+                if file_hash is None:
+                    file_hash = self._hasher.compute_hash(file_path)
+                new_hash = (
+                    self._sidecar_hash(new_path, existing_sidecar)
+                    or self._hasher.compute_hash(new_path)
+                )
+                is_same_file = (file_hash == new_hash)
+                log_verbose("Hash comparison: same=%s", is_same_file)
+            except Exception as e:
+                log_verbose("Hash comparison failed: %s", e)
+        
+        if is_same_file:
+            # Same file (case change only) - proceed with rename
+            log_verbose("Same file detected, case change only: %s -> %s", filename, new_path.name)
+            return new_path, file_hash
+        
+        # Different file exists - check if already renamed via sidecar
+        if existing_sidecar and existing_sidecar.original_filename == filename:
+            log_verbose("File already renamed previously: %s", filename)
+            return None, file_hash
+        
+        # True collision - add hash suffix
+        base, ext = self._sanitizer.split_filename(new_path.name)
+        safe_name = self._sanitizer.add_collision_suffix(base, ext, filename)
+        log_verbose("Collision detected, suffix added: %s", safe_name)
+        return new_path.parent / safe_name, file_hash
+    
+    def _rename_after(
+        self,
+        after: set[Future[RenameResult]],
+        file_path: Path,
+        dry_run: bool,
+        timestamp: Optional[str]
+    ) -> RenameResult:
+        """
+        Rename a file once the conflicting renames before it have finished.
+        
+        Cannot deadlock: those renames were submitted earlier, so the pool
+        has already started them.
+        """
+        if after:
+            wait(after)
+        return self.rename_file(file_path, dry_run, timestamp)
+    
+    def _conflict_names(self, filename: str) -> set[str]:
+        """
+        Return casefolded names a file's rename may read or write.
+        
+        Two renames in the same directory can only interact if these sets
+        overlap: source name, target name, collision-suffixed target name
+        and the sidecar names of both targets.
+        """
+        names = {filename.casefold()}
+        if not self._sanitizer.needs_rename(filename):
+            return names
+        
+        safe_name = self._sanitizer.sanitize(filename)
+        base, ext = self._sanitizer.split_filename(safe_name)
+        suffixed = self._sanitizer.add_collision_suffix(base, ext, filename)
+        for name in (safe_name, suffixed):
+            names.add(name.casefold())
+            names.add((name + SIDECAR_SUFFIX).casefold())
+        return names
+    
     def get_stats(self, results: list[RenameResult]) -> OperationStats:
         """
         Calculate statistics from results.
@@ -243,18 +417,91 @@ class BaseFileRenamer(ABC):
         Returns:
             OperationStats with aggregated metrics
         """
-        stats = OperationStats(
+        renamed = skipped = errors = 0
+        for r in results:
+            if r.skipped:
+                skipped += 1
+            elif r.success:
+                renamed += 1
+            else:
+                errors += 1
+        
+        return OperationStats(
             total_files=len(results),
-            renamed=sum(1 for r in results if r.success and not r.skipped),
-            skipped=sum(1 for r in results if r.skipped),
-            errors=sum(1 for r in results if not r.success)
+            renamed=renamed,
+            skipped=skipped,
+            errors=errors
         )
-        return stats
     
-    def _log_verbose(self, message: str) -> None:
-        """Log message if verbose mode enabled."""
-        if self._verbose:
-            self._logger.debug(message)
+    def _sidecar_hash(
+        self,
+        file_path: Path,
+        sidecar: Optional[SidecarContent]
+    ) -> Optional[str]:
+        """Return hash stored in sidecar if it still matches the file, else None."""
+        if sidecar is None:
+            return None
+        mtime_ns = self._get_file_mtime_ns(file_path)
+        if mtime_ns is None:
+            return None
+        if not sidecar.describes(
+            self._get_file_size(file_path), mtime_ns, self._hasher.algorithm_name
+        ):
+            return None
+        self._log_verbose("Reusing hash from sidecar: %s", file_path)
+        return sidecar.hash
+    
+    def _get_file_mtime_ns(self, file_path: Path) -> Optional[int]:
+        """
+        Get file modification time in nanoseconds.
+        
+        Recorded in sidecars so later runs can reuse the stored hash.
+        Subclasses override when the filesystem provides reliable mtimes.
+        
+        Args:
+            file_path: Path to file
+        
+        Returns:
+            Modification time, or None if unavailable
+        """
+        return None
+    
+    def _perform_rename_exclusive(self, old_path: Path, new_path: Path) -> None:
+        """
+        Perform rename unless new_path already exists.
+        
+        Checks file_exists() first; subclasses override when the
+        filesystem can refuse an existing target atomically.
+        
+        Args:
+            old_path: Current file path
+            new_path: Target file path
+        
+        Raises:
+            FileExistsError: If new_path exists (nothing was renamed)
+            IOError: If rename fails
+        """
+        if self._file_ops.file_exists(new_path):
+            raise FileExistsError(f"Target exists: {new_path}")
+        self._perform_rename(old_path, new_path)
+    
+    def _get_file_stat(self, file_path: Path) -> tuple[int, Optional[int]]:
+        """
+        Get file size and modification time together.
+        
+        Defaults to _get_file_size() and _get_file_mtime_ns(); subclasses
+        override when one call returns both.
+        
+        Args:
+            file_path: Path to file
+        
+        Returns:
+            (size in bytes, modification time in nanoseconds or None)
+        
+        Raises:
+            IOError: If the size can't be determined
+        """
+        return self._get_file_size(file_path), self._get_file_mtime_ns(file_path)
     
     # Abstract methods for subclasses to implement
     
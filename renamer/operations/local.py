@@ -7,14 +7,52 @@ Uses native Python file operations.
 
 from __future__ import annotations
 from pathlib import Path
+import os
 import shutil
-from typing import Optional
+from typing import Iterator, Optional
 import logging
 
 from ..protocols import FileOperationsProtocol
 from .base import BaseFileRenamer
 
 
+def _scandir_recursive(path: str, recursive: bool = True) -> Iterator[os.DirEntry[str]]:
+    """
+    Yield file entries below path using os.scandir.
+    
+    DirEntry carries the file type read with the directory itself, so no
+    extra stat() is issued per entry (unlike Path.rglob + Path.is_file).
+    Matches Path.rglob semantics: symlinked files are listed, symlinked
+    directories are not descended into, unreadable subdirectories are skipped.
+    
+    Each directory is read completely before its files are yielded, so
+    callers may rename files while iterating without seeing them twice.
+    A directory's files are yielded before its subdirectories are walked.
+    
+    Args:
+        path: Directory to scan
+        recursive: Whether to descend into subdirectories
+    
+    Yields:
+        DirEntry for each file found
+    """
+    with os.scandir(path) as it:
+        entries = list(it)
+    
+    subdirs = []
+    for entry in entries:
+        if entry.is_file():
+            yield entry
+        elif recursive and entry.is_dir(follow_symlinks=False):
+            subdirs.append(entry.path)
+    
+    for subdir in subdirs:
+        try:
+            yield from _scandir_recursive(subdir, recursive)
+        except PermissionError:
+            pass
+
+
 class LocalFileOperations:
     """
     File operations for local filesystem.
@@ -25,6 +63,8 @@ class LocalFileOperations:
     Thread-safe and stateless.
     """
     
+    __slots__ = ('_logger',)
+    
     def __init__(self):
         """Initialize local file operations."""
         self._logger = logging.getLogger(__name__)
@@ -41,7 +81,7 @@ class LocalFileOperations:
             IOError: If rename fails
         """
         try:
-            old_path.rename(new_path)
+            os.rename(old_path, new_path)
         except OSError as e:
             self._logger.error(f"Failed to rename {old_path} to {new_path}: {e}")
             raise IOError(f"Rename failed: {e}") from e
@@ -64,38 +104,28 @@ class LocalFileOperations:
             IOError: If file doesn't exist
         """
         try:
-            return file_path.stat().st_size
+            return os.stat(file_path).st_size
         except OSError as e:
             raise IOError(f"Failed to get file size: {e}") from e
     
-    def list_files(self, directory: Path, recursive: bool = False) -> list[Path]:
+    def list_files(self, directory: Path, recursive: bool = False) -> Iterator[Path]:
         """
         List files in directory (local filesystem).
         
+        Lazy: directories are read as the iterator advances.
+        
         Args:
             directory: Directory to list
             recursive: Whether to recurse into subdirectories
         
-        Returns:
-            List of file paths (excluding directories)
+        Yields:
+            File paths (excluding directories)
         """
-        files = []
-        
         try:
-            if recursive:
-                # Use rglob for recursive listing
-                for item in directory.rglob('*'):
-                    if item.is_file():
-                        files.append(item)
-            else:
-                # Use iterdir for non-recursive
-                for item in directory.iterdir():
-                    if item.is_file():
-                        files.append(item)
+            for entry in _scandir_recursive(os.fspath(directory), recursive):
+                yield Path(entry.path)
         except OSError as e:
             self._logger.error(f"Failed to list directory {directory}: {e}")
-        
-        return files
 
 
 class LocalFileRenamer(BaseFileRenamer):
@@ -113,22 +143,70 @@ class LocalFileRenamer(BaseFileRenamer):
         ...     print(f"Renamed to {result.new_path}")
     """
     
+    __slots__ = ()
+    
     def _perform_rename(self, old_path: Path, new_path: Path) -> None:
         """
         Perform rename on local filesystem.
         
-        Uses native Path.rename() which works for local and UNC paths.
+        Uses os.rename(), which works for local and UNC paths.
+        
+        Args:
+            old_path: Current file path
+            new_path: Target file path
+        
+        Raises:
+            IOError: If rename fails
+        """
+        try:
+            os.rename(old_path, new_path)
+        except OSError as e:
+            self._logger.error(f"Failed to rename {old_path} to {new_path}: {e}")
+            raise IOError(f"Local rename failed: {e}") from e
+    
+    def _perform_rename_exclusive(self, old_path: Path, new_path: Path) -> None:
+        """
+        Rename on local filesystem unless new_path exists, without a pre-check.
+        
+        Windows os.rename() already refuses an existing target. On POSIX,
+        where rename() replaces it, the file is hard-linked to the new name
+        (which fails if it exists) and the old name removed. Filesystems
+        without hard links fall back to a check and os.rename().
         
         Args:
             old_path: Current file path
             new_path: Target file path
         
         Raises:
+            FileExistsError: If new_path exists (nothing was renamed)
             IOError: If rename fails
         """
+        if os.name == 'nt':
+            try:
+                os.rename(old_path, new_path)
+            except FileExistsError:
+                raise
+            except OSError as e:
+                self._logger.error(f"Failed to rename {old_path} to {new_path}: {e}")
+                raise IOError(f"Local rename failed: {e}") from e
+            return
+        
         try:
-            old_path.rename(new_path)
+            os.link(old_path, new_path, follow_symlinks=False)
+        except FileExistsError:
+            raise
+        except OSError:
+            # No hard links here (e.g., FAT, some network shares)
+            if os.path.lexists(new_path):
+                raise FileExistsError(f"Target exists: {new_path}")
+            self._perform_rename(old_path, new_path)
+            return
+        
+        try:
+            os.unlink(old_path)
         except OSError as e:
+            # Leave the file under its old name only
+            os.unlink(new_path)
             self._logger.error(f"Failed to rename {old_path} to {new_path}: {e}")
             raise IOError(f"Local rename failed: {e}") from e
     
@@ -146,6 +224,40 @@ class LocalFileRenamer(BaseFileRenamer):
             IOError: If file doesn't exist
         """
         try:
-            return file_path.stat().st_size
+            return os.stat(file_path).st_size
+        except OSError as e:
+            raise IOError(f"Failed to get file size: {e}") from e
+    
+    def _get_file_mtime_ns(self, file_path: Path) -> Optional[int]:
+        """
+        Get modification time from local filesystem.
+        
+        Args:
+            file_path: Local file path
+        
+        Returns:
+            Modification time in nanoseconds, or None if stat fails
+        """
+        try:
+            return os.stat(file_path).st_mtime_ns
+        except OSError:
+            return None
+    
+    def _get_file_stat(self, file_path: Path) -> tuple[int, Optional[int]]:
+        """
+        Get size and modification time with a single os.stat().
+        
+        Args:
+            file_path: Local file path
+        
+        Returns:
+            (size in bytes, modification time in nanoseconds)
+        
+        Raises:
+            IOError: If file doesn't exist
+        """
+        try:
+            st = os.stat(file_path)
         except OSError as e:
             raise IOError(f"Failed to get file size: {e}") from e
+        return st.st_size, st.st_mtime_ns
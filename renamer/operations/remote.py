@@ -2,52 +2,171 @@
 Remote file operations via rclone.
 
 Handles file renaming on remote filesystems (Google Drive, etc.) using rclone.
-Implements copy+verify+delete strategy for reliability.
+Renames within one remote are server-side moves; renames across remotes
+(or when verification is requested) use a copy+verify+delete strategy.
 """
 
 from __future__ import annotations
 from pathlib import Path
+import json
 import subprocess
-from typing import Optional
+import tempfile
+from typing import Iterator, Optional
 import logging
 
+from ..domain.models import RenameResult
 from ..protocols import FileOperationsProtocol
+from ..core.hash_strategy import MD5HashComputer
+from ..core.rclone_rc import (
+    RcloneRCClient,
+    parse_rclone_json,
+    split_remote_path
+)
+from ..core.sidecar import RcloneSidecarWriter
 from .base import BaseFileRenamer
 
 
+# Remote renames wait on network round trips rather than local CPU or
+# disk, so the default pool size does not scale with the core count
+DEFAULT_REMOTE_WORKERS = 16
+
+
+def _same_remote(old_path: Path | str, new_path: Path | str) -> bool:
+    """Check whether both paths are on the same rclone remote."""
+    return str(old_path).split(':', 1)[0] == str(new_path).split(':', 1)[0]
+
+
+def _rename_via_rc(
+    rc: RcloneRCClient,
+    old_path: Path,
+    new_path: Path,
+    move: bool
+) -> None:
+    """
+    Rename a remote file through an rc server.
+    
+    Args:
+        rc: Running rc client
+        old_path: Current remote path
+        new_path: Target remote path
+        move: Use one server-side move instead of copy+verify+delete
+    
+    Raises:
+        IOError: If rename fails
+    """
+    try:
+        if move:
+            rc.move_file(old_path, new_path)
+            return
+        
+        rc.copy_file(old_path, new_path)
+        
+        if rc.stat(new_path) is None:
+            raise IOError(f"Copy verification failed: {new_path} not found")
+        
+        rc.delete_file(old_path)
+    except IOError as e:
+        logging.getLogger(__name__).error(f"rclone rc rename failed for {old_path}: {e}")
+        raise IOError(f"Remote rename failed: {e}") from e
+
+
+def _size_via_rc(rc: RcloneRCClient, file_path: Path) -> int:
+    """
+    Get a remote file's size through an rc server.
+    
+    Raises:
+        IOError: If the file doesn't exist or the call fails
+    """
+    try:
+        item = rc.stat(file_path)
+    except IOError as e:
+        raise IOError(f"Failed to get file size: {e}") from e
+    if item is None:
+        raise IOError(f"Failed to get file size: {file_path} not found")
+    size: int = item.get('Size', 0)
+    return size
+
+
 class RemoteFileOperations:
     """
     File operations for remote filesystem via rclone.
     
-    Implements FileOperationsProtocol using rclone commands.
-    Thread-safe and stateless.
+    Implements FileOperationsProtocol using rclone commands. With an rc
+    client, every operation is a request to the running rclone rcd server
+    instead of a new rclone process.
+    
+    list_files() records every file it lists with its size, so that
+    get_file_size() and file_exists() answer listed files without asking
+    the remote again. Once a listing has completed, file_exists() also
+    answers False for unlisted names in that directory. Renames done
+    through this object keep the record current; listing a directory again
+    replaces its record, and clear_listings() drops all of it.
+    
+    Sizes of unlisted files come from lsjson --stat (operations/stat over
+    rc), a single-file metadata call; rclone releases without
+    lsjson --stat fall back to size --json.
+    
+    Renames within one remote are a single server-side move (rclone
+    moveto), which most backends implement as one rename API call without
+    transferring data. Renames across remotes, or all renames when
+    verify is set, copy the file, check the copy exists and only then
+    delete the original.
+    
+    Thread-safe.
     
     Example:
         >>> ops = RemoteFileOperations()
         >>> ops.rename_file(Path("agdrive:old.txt"), Path("agdrive:new.txt"))
     """
     
-    def __init__(self, rclone_path: Optional[Path] = None):
+    __slots__ = (
+        '_rclone', '_prefix', '_rc', '_verify',
+        '_listed', '_listed_folded', '_listed_dirs', '_logger'
+    )
+    
+    def __init__(
+        self,
+        rclone_path: Optional[Path] = None,
+        rc_client: Optional[RcloneRCClient] = None,
+        verify: bool = False
+    ):
         """
         Initialize remote file operations.
         
         Args:
             rclone_path: Path to rclone executable (uses 'rclone' if None)
+            rc_client: Running rclone rcd client (caller owns its lifetime)
+            verify: Rename with copy+verify+delete even within one remote
         """
         self._rclone = str(rclone_path) if rclone_path else 'rclone'
+        self._prefix = (self._rclone,)
+        self._rc = rc_client
+        self._verify = verify
+        # Files seen by list_files(), keyed by str(path) -> size (None: unknown)
+        self._listed: dict[str, Optional[int]] = {}
+        # Case-folded paths ever recorded, so unlisted names that differ
+        # only in case are still checked on (case-insensitive) remotes
+        self._listed_folded: set[str] = set()
+        # Directories whose listing completed -> listed recursively
+        self._listed_dirs: dict[Path, bool] = {}
         self._logger = logging.getLogger(__name__)
     
     def _run_rclone(
         self,
-        args: list[str],
-        input_data: Optional[str] = None
+        *args: str,
+        input_data: Optional[str] = None,
+        text: bool = True,
+        need_stdout: bool = True
     ) -> subprocess.CompletedProcess:
         """
         Run rclone command with UTF-8 encoding.
         
         Args:
-            args: rclone command arguments
+            *args: rclone command arguments
             input_data: Optional stdin input
+            text: Decode output as UTF-8 (False: raw bytes, e.g. for JSON)
+            need_stdout: Capture stdout (False: discard it; stderr is
+                still captured for error messages)
         
         Returns:
             Completed process
@@ -55,14 +174,13 @@ class RemoteFileOperations:
         Raises:
             subprocess.CalledProcessError: If command fails
         """
-        cmd = [self._rclone] + args
-        
         result = subprocess.run(
-            cmd,
+            self._prefix + args,
             input=input_data,
-            capture_output=True,
-            text=True,
-            encoding='utf-8',
+            stdout=subprocess.PIPE if need_stdout else subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=text,
+            encoding='utf-8' if text else None,
             check=True
         )
         
@@ -70,9 +188,10 @@ class RemoteFileOperations:
     
     def rename_file(self, old_path: Path, new_path: Path) -> None:
         """
-        Rename file on remote via rclone using copy+verify+delete.
+        Rename file on remote via rclone.
         
-        Strategy (more reliable than moveto):
+        Within one remote: a single moveto (server-side move). Across
+        remotes, or with verify set, copy+verify+delete:
         1. copyto old_path new_path
         2. Verify new_path exists
         3. deletefile old_path
@@ -84,29 +203,94 @@ class RemoteFileOperations:
         Raises:
             IOError: If rename fails
         """
+        old, new = str(old_path), str(new_path)
+        move = not self._verify and _same_remote(old, new)
+        
+        rc = self._rc
+        if rc is not None:
+            _rename_via_rc(rc, old_path, new_path, move)
+            self._record_move(old_path, new_path)
+            self._logger.debug("Renamed via rclone rc: %s -> %s", old_path, new_path)
+            return
+        
         try:
+            if move:
+                self._run_rclone('moveto', old, new, need_stdout=False)
+                self._record_move(old_path, new_path)
+                self._logger.debug("Renamed (moveto): %s -> %s", old_path, new_path)
+                return
+            
             # Step 1: Copy to new location
-            self._run_rclone(['copyto', str(old_path), str(new_path)])
+            self._run_rclone('copyto', old, new, need_stdout=False)
             
-            # Step 2: Verify new file exists
-            if not self.file_exists(new_path):
+            # Step 2: Verify new file exists (on the remote, not the record)
+            if not self._exists_on_remote(new_path):
                 raise IOError(f"Copy verification failed: {new_path} not found")
             
             # Step 3: Delete old file
-            self._run_rclone(['deletefile', str(old_path)])
+            self._run_rclone('deletefile', old, need_stdout=False)
             
-            self._logger.debug(f"Renamed (copy+delete): {old_path} -> {new_path}")
+            self._record_move(old_path, new_path)
+            self._logger.debug("Renamed (copy+delete): %s -> %s", old_path, new_path)
             
         except subprocess.CalledProcessError as e:
             error_msg = e.stderr.strip() if e.stderr else str(e)
             self._logger.error(f"rclone rename failed for {old_path}: {error_msg}")
             raise IOError(f"Remote rename failed: {error_msg}") from e
     
+    def _record_move(self, old_path: Path, new_path: Path) -> None:
+        """Move a file's record (and known size) over to its new name."""
+        new = str(new_path)
+        self._listed[new] = self._listed.pop(str(old_path), None)
+        self._listed_folded.add(new.casefold())
+    
+    def _forget_listing(self, directory: Path) -> None:
+        """
+        Drop the record covering directory before it is listed again.
+        
+        Removes its files, its subdirectories' listings and any listing of
+        a parent directory, so names created since then are not reported
+        missing from a stale listing.
+        """
+        base = Path(str(directory))
+        prefix = str(base) + '/'
+        folded_prefix = prefix.casefold()
+        
+        for path in [path for path in self._listed if path.startswith(prefix)]:
+            del self._listed[path]
+        self._listed_folded.difference_update(
+            [path for path in self._listed_folded if path.startswith(folded_prefix)]
+        )
+        for listed_dir in [
+            d for d in self._listed_dirs
+            if d == base or base in d.parents or d in base.parents
+        ]:
+            del self._listed_dirs[listed_dir]
+    
+    def clear_listings(self) -> None:
+        """
+        Forget every list_files() record.
+        
+        Later existence checks and size lookups ask the remote again.
+        """
+        self._listed.clear()
+        self._listed_folded.clear()
+        self._listed_dirs.clear()
+    
+    def _is_listed(self, directory: Path) -> bool:
+        """Check if directory is covered by a completed list_files() call."""
+        if directory in self._listed_dirs:
+            return True
+        return any(
+            self._listed_dirs.get(parent, False) for parent in directory.parents
+        )
+    
     def file_exists(self, file_path: Path) -> bool:
         """
         Check if file exists on remote.
         
-        Uses rclone lsf with --files-only.
+        Answers from the list_files() record when the file or its whole
+        directory was listed, else uses rclone lsf with --files-only.
         
         Args:
             file_path: Remote path to check
@@ -114,8 +298,24 @@ class RemoteFileOperations:
         Returns:
             True if file exists
         """
+        path = str(file_path)
+        if path in self._listed:
+            return True
+        if self._is_listed(file_path.parent) and path.casefold() not in self._listed_folded:
+            return False
+        
+        return self._exists_on_remote(file_path)
+    
+    def _exists_on_remote(self, file_path: Path) -> bool:
+        """Check if file exists by asking the remote (bypasses the record)."""
+        if self._rc is not None:
+            try:
+                return self._rc.stat(file_path) is not None
+            except IOError:
+                return False
+        
         try:
-            result = self._run_rclone(['lsf', '--files-only', str(file_path)])
+            result = self._run_rclone('lsf', '--files-only', str(file_path))
             # If file exists, lsf returns the filename
             return bool(result.stdout.strip())
         except subprocess.CalledProcessError:
@@ -123,7 +323,11 @@ class RemoteFileOperations:
     
     def get_file_size(self, file_path: Path) -> int:
         """
-        Get file size in bytes via rclone size.
+        Get file size in bytes via rclone lsjson --stat.
+        
+        Answers from the list_files() record when the file was listed.
+        lsjson --stat reads one file's metadata in a single API call;
+        rclone releases without the flag fall back to size --json.
         
         Args:
             file_path: Remote file path
@@ -134,50 +338,131 @@ class RemoteFileOperations:
         Raises:
             IOError: If file doesn't exist or size can't be determined
         """
+        size = self._listed.get(str(file_path))
+        if size is not None:
+            return size
+        
+        if self._rc is not None:
+            return _size_via_rc(self._rc, file_path)
+        
+        path = str(file_path)
         try:
-            result = self._run_rclone(['size', '--json', str(file_path)])
-            
-            import json
-            data = json.loads(result.stdout)
-            size = data.get('bytes', 0)
+            try:
+                result = self._run_rclone('lsjson', '--stat', path, text=False)
+                size = parse_rclone_json(result.stdout)['Size']
+            except subprocess.CalledProcessError as e:
+                if b'unknown flag' not in (e.stderr or b''):
+                    raise
+                result = self._run_rclone('size', '--json', path, text=False)
+                size = parse_rclone_json(result.stdout).get('bytes', 0)
             
             return size
             
-        except (subprocess.CalledProcessError, json.JSONDecodeError, KeyError) as e:
+        except (subprocess.CalledProcessError, json.JSONDecodeError, KeyError, TypeError) as e:
             raise IOError(f"Failed to get file size: {e}") from e
     
-    def list_files(self, directory: Path, recursive: bool = False) -> list[Path]:
+    def list_files(self, directory: Path, recursive: bool = False) -> Iterator[Path]:
         """
-        List files in remote directory.
+        List files in remote directory and record their sizes.
         
-        Uses rclone lsf with --files-only.
+        Uses rclone lsf with --files-only, listing path and size. Lazy:
+        lines are read from rclone's output pipe as the iterator advances,
+        so the listing is never held in memory as a whole. Replaces any
+        earlier record of the directory.
         
         Args:
             directory: Remote directory path
             recursive: Whether to recurse into subdirectories
         
-        Returns:
-            List of remote file paths
+        Yields:
+            Remote file paths
         """
-        files = []
+        self._forget_listing(directory)
+        if self._rc is not None:
+            yield from self._list_files_rc(self._rc, directory, recursive)
+            return
         
-        try:
-            args = ['lsf', '--files-only']
-            if recursive:
-                args.append('--recursive')
-            args.append(str(directory))
+        flags = ('--recursive',) if recursive else ()
+        cmd = self._prefix + (
+            'lsf', '--files-only', '--format=ps', '--separator=|', *flags, str(directory)
+        )
+        base = Path(str(directory))
+        listed = self._listed
+        fold = self._listed_folded.add
+        
+        # stderr goes to a file: a pipe left unread while stdout is
+        # consumed lazily could fill up and stall rclone
+        with tempfile.TemporaryFile() as stderr_file:
+            try:
+                proc = subprocess.Popen(
+                    cmd,
+                    stdout=subprocess.PIPE,
+                    stderr=stderr_file,
+                    text=True,
+                    encoding='utf-8'
+                )
+            except OSError as e:
+                self._logger.error(f"Failed to list directory {directory}: {e}")
+                return
+            assert proc.stdout is not None
             
-            result = self._run_rclone(args)
+            with proc:
+                try:
+                    # One "path|size" per line
+                    for line in proc.stdout:
+                        name, _, size = line.rstrip('\n').rpartition('|')
+                        if not name:
+                            continue
+                        file_path = base / name
+                        path = str(file_path)
+                        listed[path] = int(size) if size.isdigit() else None
+                        fold(path.casefold())
+                        yield file_path
+                except GeneratorExit:
+                    # Caller stopped early; don't wait for the rest of the listing
+                    proc.kill()
+                    raise
             
-            # Parse output - one file per line
-            for line in result.stdout.strip().split('\n'):
-                if line:
-                    file_path = Path(str(directory)) / line
-                    files.append(file_path)
-                    
-        except subprocess.CalledProcessError as e:
+            if proc.returncode:
+                stderr_file.seek(0)
+                error_msg = stderr_file.read().decode('utf-8', 'replace').strip()
+                self._logger.error(
+                    f"Failed to list directory {directory}: "
+                    f"{error_msg or subprocess.CalledProcessError(proc.returncode, cmd)}"
+                )
+            else:
+                self._listed_dirs[base] = recursive
+    
+    def _list_files_rc(
+        self,
+        rc: RcloneRCClient,
+        directory: Path,
+        recursive: bool
+    ) -> list[Path]:
+        """List files through the rc server; same paths as the lsf listing."""
+        _, remote = split_remote_path(directory)
+        prefix = remote.strip('/') + '/' if remote.strip('/') else ''
+        base = Path(str(directory))
+        
+        try:
+            items = rc.list_files(directory, recursive=recursive)
+        except IOError as e:
             self._logger.error(f"Failed to list directory {directory}: {e}")
+            return []
         
+        # rc paths are relative to the remote root, lsf paths to directory
+        files: list[Path] = []
+        append = files.append
+        listed = self._listed
+        fold = self._listed_folded.add
+        for item in items:
+            file_path = base / item['Path'].removeprefix(prefix)
+            append(file_path)
+            size = item.get('Size', -1)
+            path = str(file_path)
+            listed[path] = size if size >= 0 else None
+            fold(path.casefold())
+        self._listed_dirs[base] = recursive
         return files
 
 
@@ -188,6 +473,12 @@ class RemoteFileRenamer(BaseFileRenamer):
     Extends BaseFileRenamer with rclone-specific implementations.
     Uses MD5 for hashing (what rclone returns for most remotes).
     
+    Renames and size lookups go through the RemoteFileOperations, which
+    answer sizes of listed files from their listing and use an rclone rcd
+    server only when built with an rc_client (see
+    FileRenamerFactory.create_remote_renamer() and shared_rc_client());
+    otherwise each of them spawns rclone processes.
+    
     Example:
         >>> from ..factory import FileRenamerFactory
         >>> renamer = FileRenamerFactory.create_remote_renamer(verbose=True)
@@ -196,7 +487,14 @@ class RemoteFileRenamer(BaseFileRenamer):
         ...     print(f"Renamed to {result.new_path}")
     """
     
-    def __init__(self, *args, rclone_path: Optional[Path] = None, **kwargs):
+    __slots__ = ('_rclone_path',)
+    
+    def __init__(
+        self,
+        *args,
+        rclone_path: Optional[Path] = None,
+        **kwargs
+    ):
         """
         Initialize remote file renamer.
         
@@ -206,32 +504,102 @@ class RemoteFileRenamer(BaseFileRenamer):
         """
         super().__init__(*args, **kwargs)
         self._rclone_path = rclone_path
-        self._rclone = str(rclone_path) if rclone_path else 'rclone'
     
-    def _run_rclone(
+    def rename_directory(
         self,
-        args: list[str],
-        input_data: Optional[str] = None
-    ) -> subprocess.CompletedProcess:
-        """Run rclone command with UTF-8 encoding."""
-        cmd = [self._rclone] + args
+        directory: Path,
+        recursive: bool = True,
+        dry_run: bool = False,
+        max_workers: Optional[int] = None,
+        precise_timestamps: bool = False
+    ) -> list[RenameResult]:
+        """
+        Rename all files in remote directory.
         
-        result = subprocess.run(
-            cmd,
-            input=input_data,
-            capture_output=True,
-            text=True,
-            encoding='utf-8',
-            check=True
-        )
+        Before walking the files, fetches all MD5 hashes and the list of
+        existing sidecars with one rclone call each, instead of one
+        rclone process per file. Sidecars are uploaded together, every
+        SIDECAR_FLUSH_EVERY files and at the end. The directory listing,
+        prefetched hashes and sidecar index are only trusted during the
+        run: afterwards the remote is asked again.
         
-        return result
+        Args:
+            directory: Remote directory to process
+            recursive: Whether to recurse into subdirectories
+            dry_run: If True, simulate without actual rename
+            max_workers: Worker threads (default DEFAULT_REMOTE_WORKERS;
+                see BaseFileRenamer.rename_directory)
+            precise_timestamps: Stamp each sidecar with its own rename time
+        
+        Returns:
+            List of RenameResult for each file processed
+        """
+        max_workers = max_workers or DEFAULT_REMOTE_WORKERS
+        
+        try:
+            return self._rename_directory_run(
+                directory, recursive, dry_run, max_workers, precise_timestamps
+            )
+        finally:
+            # Listings, hashes and sidecar index are snapshots of this run;
+            # files may appear or change afterwards
+            if isinstance(self._file_ops, RemoteFileOperations):
+                self._file_ops.clear_listings()
+            if isinstance(self._hasher, MD5HashComputer):
+                self._hasher.clear_cache()
+            if isinstance(self._sidecar_writer, RcloneSidecarWriter):
+                self._sidecar_writer.clear_index()
+    
+    def _rename_directory_run(
+        self,
+        directory: Path,
+        recursive: bool,
+        dry_run: bool,
+        max_workers: int,
+        precise_timestamps: bool
+    ) -> list[RenameResult]:
+        """Prefetch, then rename the directory (see rename_directory())."""
+        try:
+            if isinstance(self._hasher, MD5HashComputer):
+                self._hasher.compute_hashes_bulk(directory, recursive=recursive)
+            if isinstance(self._sidecar_writer, RcloneSidecarWriter):
+                self._sidecar_writer.index_sidecars(directory, recursive=recursive)
+        except IOError as e:
+            # Per-file rclone calls still work, just slower
+            self._logger.warning(f"Bulk prefetch failed for {directory}: {e}")
+        
+        if dry_run or not isinstance(self._sidecar_writer, RcloneSidecarWriter):
+            return super().rename_directory(
+                directory, recursive=recursive, dry_run=dry_run,
+                max_workers=max_workers, precise_timestamps=precise_timestamps
+            )
+        
+        self._sidecar_writer.begin_batch(directory)
+        results = []
+        try:
+            results = super().rename_directory(
+                directory, recursive=recursive, dry_run=dry_run,
+                max_workers=max_workers, precise_timestamps=precise_timestamps
+            )
+        finally:
+            pending = self._sidecar_writer.staged_sidecars()
+            try:
+                self._sidecar_writer.flush_batch(directory)
+            except IOError as e:
+                self._logger.error(f"Failed to upload sidecars for {directory}: {e}")
+                results = [
+                    RenameResult.failure(r.original_path, str(e))
+                    if r.sidecar_path is not None and str(r.sidecar_path) in pending else r
+                    for r in results
+                ]
+        
+        return results
     
     def _perform_rename(self, old_path: Path, new_path: Path) -> None:
         """
-        Perform rename on remote via rclone.
+        Perform rename on remote via the file operations.
         
-        Uses copy+verify+delete strategy for reliability.
+        See RemoteFileOperations.rename_file() for the strategy.
         
         Args:
             old_path: Current remote path
@@ -240,28 +608,11 @@ class RemoteFileRenamer(BaseFileRenamer):
         Raises:
             IOError: If rename fails
         """
-        try:
-            # Step 1: Copy to new location
-            self._run_rclone(['copyto', str(old_path), str(new_path)])
-            
-            # Step 2: Verify new file exists
-            result = self._run_rclone(['lsf', '--files-only', str(new_path)])
-            if not result.stdout.strip():
-                raise IOError(f"Copy verification failed: {new_path} not found")
-            
-            # Step 3: Delete old file
-            self._run_rclone(['deletefile', str(old_path)])
-            
-            self._logger.debug(f"Renamed via rclone: {old_path} -> {new_path}")
-            
-        except subprocess.CalledProcessError as e:
-            error_msg = e.stderr.strip() if e.stderr else str(e)
-            self._logger.error(f"rclone rename failed for {old_path}: {error_msg}")
-            raise IOError(f"Remote rename failed: {error_msg}") from e
+        self._file_ops.rename_file(old_path, new_path)
     
     def _get_file_size(self, file_path: Path) -> int:
         """
-        Get file size from remote via rclone size.
+        Get file size from remote via the file operations.
         
         Args:
             file_path: Remote file path
@@ -272,14 +623,4 @@ class RemoteFileRenamer(BaseFileRenamer):
         Raises:
             IOError: If size can't be determined
         """
-        try:
-            result = self._run_rclone(['size', '--json', str(file_path)])
-            
-            import json
-            data = json.loads(result.stdout)
-            size = data.get('bytes', 0)
-            
-            return size
-            
-        except (subprocess.CalledProcessError, json.JSONDecodeError, KeyError) as e:
-            raise IOError(f"Failed to get file size: {e}") from e
+        return self._file_ops.get_file_size(file_path)
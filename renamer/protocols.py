@@ -4,22 +4,28 @@ Protocol interfaces for file renaming operations.
 Following PEP 544 (Protocol - Structural Subtyping), these define contracts
 without inheritance, enabling flexible dependency injection and testing.
 
-All protocols use @runtime_checkable for isinstance() checks.
+Protocols are checked statically only; nothing calls isinstance() on them,
+so they are not @runtime_checkable.
 """
 
 from __future__ import annotations
+import json
 from pathlib import Path
-from typing import Protocol, runtime_checkable, Optional
+from typing import Iterable, Protocol, Optional
 
 from .domain.models import RenameResult, FileMetadata, SidecarContent
 
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None  # type: ignore[assignment]
+
 
-@runtime_checkable
 class HashComputerProtocol(Protocol):
     """
     Protocol for computing file hashes.
     
-    Strategy pattern interface for different hash algorithms (SHA256, MD5).
+    Strategy pattern interface for different hash algorithms (SHA256, BLAKE3, MD5).
     Implementations must be stateless and thread-safe.
     
     Example:
@@ -48,7 +54,7 @@ class HashComputerProtocol(Protocol):
     @property
     def algorithm_name(self) -> str:
         """
-        Return hash algorithm name ('sha256' or 'md5').
+        Return hash algorithm name ('sha256', 'blake3' or 'md5').
         
         Returns:
             Lowercase algorithm name for sidecar metadata
@@ -56,7 +62,6 @@ class HashComputerProtocol(Protocol):
         ...
 
 
-@runtime_checkable
 class SidecarWriterProtocol(Protocol):
     """
     Protocol for writing sidecar .meta.json files.
@@ -79,6 +84,10 @@ class SidecarWriterProtocol(Protocol):
         """
         Write sidecar .meta.json file for a renamed file.
         
+        Implementations should produce the payload with
+        serialize_sidecar() (orjson when available)
+        and write it in one call.
+        
         Args:
             file_path: Path to the renamed file
             content: Sidecar content to write
@@ -104,7 +113,6 @@ class SidecarWriterProtocol(Protocol):
         ...
 
 
-@runtime_checkable
 class FileOperationsProtocol(Protocol):
     """
     Protocol for file operations (rename, copy, delete).
@@ -159,21 +167,22 @@ class FileOperationsProtocol(Protocol):
         """
         ...
     
-    def list_files(self, directory: Path, recursive: bool = False) -> list[Path]:
+    def list_files(self, directory: Path, recursive: bool = False) -> Iterable[Path]:
         """
         List files in directory.
         
+        May return a lazy iterator; callers needing a list call list().
+        
         Args:
             directory: Directory to list
             recursive: Whether to recurse into subdirectories
         
         Returns:
-            List of file paths (excluding directories)
+            File paths (excluding directories)
         """
         ...
 
 
-@runtime_checkable
 class FileRenamerProtocol(Protocol):
     """
     Protocol for file renaming operations.
@@ -209,7 +218,9 @@ class FileRenamerProtocol(Protocol):
         self,
         directory: Path,
         recursive: bool = True,
-        dry_run: bool = False
+        dry_run: bool = False,
+        max_workers: Optional[int] = None,
+        precise_timestamps: bool = False
     ) -> list[RenameResult]:
         """
         Rename all files in directory.
@@ -218,8 +229,28 @@ class FileRenamerProtocol(Protocol):
             directory: Directory to process
             recursive: Whether to recurse into subdirectories
             dry_run: If True, don't actually rename, just simulate
+            max_workers: Worker threads (None for implementation default)
+            precise_timestamps: Per-file sidecar timestamps instead of one per run
         
         Returns:
             List of RenameResult for each file processed
         """
         ...
+
+
+def serialize_sidecar(content: SidecarContent) -> bytes:
+    """
+    Serialize sidecar content as indented UTF-8 JSON.
+    
+    Uses orjson when installed. Writers should store the returned bytes
+    with a single write instead of streaming json.dump() into a file.
+    
+    Example:
+        >>> path.write_bytes(serialize_sidecar(content))
+    """
+    if orjson is not None:
+        # Going through to_dict() is deliberate: orjson's native dataclass
+        # path is slower for slotted dataclasses, and to_dict() leaves out
+        # an unset file_mtime_ns
+        return orjson.dumps(content.to_dict(), option=orjson.OPT_INDENT_2)
+    return json.dumps(content.to_dict(), indent=2, ensure_ascii=False).encode('utf-8')
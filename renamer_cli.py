@@ -19,15 +19,68 @@ Examples:
 """
 
 from __future__ import annotations
-import argparse
+import io
 import logging
 import sys
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Optional, cast
 
-from renamer.factory import FileRenamerFactory, print_stats
-from renamer.domain.models import OperationTiming
+if TYPE_CHECKING:
+    import argparse
+    from renamer.core.rclone_rc import RcloneRCClient
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """
+    Log file handler that writes through a large buffer.
+    
+    logging.FileHandler flushes after every record, which is one write()
+    syscall per DEBUG line on verbose runs. This handler flushes only for
+    records at flush_level or above (and when closed), so a run of debug
+    records costs one write per buffer_size bytes.
+    """
+    
+    def __init__(
+        self,
+        filename: Path,
+        encoding: str = 'utf-8',
+        buffer_size: int = 64 * 1024,
+        flush_level: int = logging.INFO
+    ):
+        """
+        Initialize handler.
+        
+        Args:
+            filename: Log file path
+            encoding: Log file encoding
+            buffer_size: Write buffer size in bytes
+            flush_level: Records at this level or above are flushed at once
+        """
+        self._buffer_size = buffer_size
+        self._flush_level = flush_level
+        super().__init__(filename, encoding=encoding)
+    
+    def _open(self) -> io.TextIOWrapper:
+        # Text mode with a buffer size always opens a TextIOWrapper
+        return cast(io.TextIOWrapper, open(
+            self.baseFilename, self.mode,
+            buffering=self._buffer_size, encoding=self.encoding, errors=self.errors
+        ))
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        stream = self.stream
+        if stream is None:
+            stream = self.stream = self._open()
+        try:
+            stream.write(self.format(record) + self.terminator)
+            if record.levelno >= self._flush_level:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
 
 
 def setup_logging(verbose: bool, log_dir: Optional[Path] = None) -> None:
@@ -54,7 +107,7 @@ def setup_logging(verbose: bool, log_dir: Optional[Path] = None) -> None:
         level=log_level,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         handlers=[
-            logging.FileHandler(log_file, encoding='utf-8'),
+            BufferedFileHandler(log_file, encoding='utf-8'),
             logging.StreamHandler(sys.stdout)
         ]
     )
@@ -64,13 +117,38 @@ def setup_logging(verbose: bool, log_dir: Optional[Path] = None) -> None:
     logger.info(f"Verbose mode: {verbose}")
 
 
-def parse_arguments() -> argparse.Namespace:
+def parse_arguments(argv: Optional[list[str]] = None) -> argparse.Namespace | SimpleNamespace:
     """
     Parse command-line arguments.
     
+    The common invocation with just a path skips building the argparse
+    parser (and importing argparse) altogether.
+    
+    Args:
+        argv: Arguments without the program name (default: sys.argv[1:])
+    
     Returns:
         Parsed arguments namespace
     """
+    if argv is None:
+        argv = sys.argv[1:]
+    
+    if len(argv) == 1 and not argv[0].startswith('-'):
+        return SimpleNamespace(
+            path=argv[0],
+            dry_run=False,
+            verbose=False,
+            rclone_path=None,
+            rcd=False,
+            transfers=None,
+            hash_algorithm='sha256',
+            fastest_hash=False,
+            io_uring=False,
+            log_dir=None
+        )
+    
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description='Rename files to cross-platform safe format',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -80,6 +158,8 @@ Examples:
   %(prog)s "\\\\server\\share\\folder"      # Rename UNC path
   %(prog)s "gdrive:backups" --dry-run       # Preview remote renames
   %(prog)s "gdrive:photos" --verbose        # Verbose remote rename
+  %(prog)s "gdrive:photos" --transfers 32   # Rename 32 files at a time
+  %(prog)s "C:/my files" --hash-algorithm blake3  # Faster local hashing
         """
     )
     
@@ -108,6 +188,43 @@ Examples:
         help='Path to rclone executable (default: use system rclone)'
     )
     
+    parser.add_argument(
+        '--rcd',
+        action='store_true',
+        help='Run one persistent rclone rcd server for remote paths '
+             'instead of spawning rclone per operation'
+    )
+    
+    parser.add_argument(
+        '--transfers',
+        type=int,
+        default=None,
+        metavar='N',
+        help='Number of files renamed in parallel '
+             '(default: 16 for remote paths, scaled to CPU count for local)'
+    )
+    
+    parser.add_argument(
+        '--hash-algorithm',
+        choices=('sha256', 'blake3', 'md5'),
+        default='sha256',
+        help='Hash for local files (default: sha256; blake3 needs the blake3 '
+             'package; remote paths always use MD5)'
+    )
+    
+    parser.add_argument(
+        '--fastest-hash',
+        action='store_true',
+        help='Hash local files with BLAKE3 when SHA256 is not hardware-accelerated '
+             'and blake3 is installed'
+    )
+    
+    parser.add_argument(
+        '--io-uring',
+        action='store_true',
+        help='Read local files through io_uring for SHA256 (Linux with liburing)'
+    )
+    
     parser.add_argument(
         '--log-dir',
         type=Path,
@@ -115,7 +232,11 @@ Examples:
         help='Directory for log files (default: ./logs/)'
     )
     
-    return parser.parse_args()
+    args = parser.parse_args(argv)
+    if args.transfers is not None and args.transfers < 1:
+        parser.error('--transfers must be at least 1')
+    
+    return args
 
 
 def main() -> int:
@@ -128,24 +249,40 @@ def main() -> int:
     # Parse arguments
     args = parse_arguments()
     
+    # Imported after parsing so --help and usage errors don't load the package
+    from renamer.factory import FileRenamerFactory, print_stats
+    from renamer.domain.models import OperationTiming
+    from renamer.core import rclone_rc
+    
     # Setup logging
     setup_logging(verbose=args.verbose, log_dir=args.log_dir)
     logger = logging.getLogger(__name__)
+    rc_client: Optional[RcloneRCClient] = None
     
     try:
         # Resolve path
         target_path = Path(args.path)
+        is_remote = FileRenamerFactory.is_remote_path(target_path)
         
         # Log operation details
         logger.info(f"Target path: {target_path}")
         logger.info(f"Dry run: {args.dry_run}")
-        logger.info(f"Path type: {'Remote' if FileRenamerFactory.is_remote_path(target_path) else 'Local'}")
+        logger.info(f"Path type: {'Remote' if is_remote else 'Local'}")
+        
+        # Start (or reuse) the persistent rclone server if requested
+        if is_remote and args.rcd:
+            rc_client = rclone_rc.shared_rc_client(args.rclone_path)
+            logger.info(f"rclone rcd running on port {rc_client.port}")
         
         # Create renamer using factory (auto-detects local vs remote)
         renamer = FileRenamerFactory.create_from_path(
             path=target_path,
             rclone_path=args.rclone_path,
-            verbose=args.verbose
+            verbose=args.verbose,
+            rc_client=rc_client,
+            hash_algorithm=args.hash_algorithm,
+            use_io_uring=args.io_uring,
+            prefer_fastest=args.fastest_hash
         )
         
         logger.info(f"Using renamer: {renamer.__class__.__name__}")
@@ -162,7 +299,8 @@ def main() -> int:
         results = renamer.rename_directory(
             directory=target_path,
             recursive=True,
-            dry_run=args.dry_run
+            dry_run=args.dry_run,
+            max_workers=args.transfers
         )
         
         # Finish timing
@@ -175,7 +313,7 @@ def main() -> int:
         # Log summary
         logger.info(f"Operation completed in {timing.duration_seconds:.2f}s")
         logger.info(f"Stats: {stats.total_files} total, {stats.renamed} renamed, "
-                   f"{stats.skipped} skipped, {stats.errors} errors")
+                    f"{stats.skipped} skipped, {stats.errors} errors")
         
         # Display errors if any
         errors = [r for r in results if not r.success]
@@ -204,6 +342,10 @@ def main() -> int:
         logger.exception(f"Fatal error: {e}")
         print(f"\nFATAL ERROR: {e}", file=sys.stderr)
         return 1
+    
+    finally:
+        if rc_client is not None:
+            rc_client.close()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,221 @@
+"""
+Tests for the rename workflow shared by local and remote renamers.
+
+Run with: pytest tests/ -v
+"""
+
+import os
+import threading
+import time
+
+import pytest
+from renamer.factory import FileRenamerFactory
+from renamer.operations import base
+
+
+# Names that sanitize to the same targets as each other or as files
+# already present, so renames must see each other's results
+COLLIDING_FILES = {
+    "My File.txt": b"one",
+    "my file.txt": b"two",
+    "MY FILE.txt": b"one",
+    "my-file.txt": b"three",
+    "Other Name.pdf": b"four",
+    "sub/My File.txt": b"five",
+    "sub/my-file.txt": b"six",
+}
+
+
+def make_tree(root, files):
+    """Create files (relative path -> content) below root"""
+    for name, content in files.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content)
+    return root
+
+
+def tree_contents(root):
+    """Relative path -> content for every non-sidecar file below root"""
+    return {
+        path.relative_to(root).as_posix(): path.read_bytes()
+        for path in root.rglob("*")
+        if path.is_file() and not path.name.endswith(".meta.json")
+    }
+
+
+def outcome(root, results):
+    """Results as comparable (original, new, skipped, error) tuples"""
+    def rel(path):
+        return path.relative_to(root).as_posix() if path else None
+    return [(rel(r.original_path), rel(r.new_path), r.skipped, r.error) for r in results]
+
+
+class Listing:
+    """File operations whose listing is observed or cut short"""
+    
+    def __init__(self, inner, fail_after=None):
+        self._inner = inner
+        self._fail_after = fail_after
+        self.yielded = 0
+    
+    def __getattr__(self, name):
+        return getattr(self._inner, name)
+    
+    def list_files(self, directory, recursive=False):
+        for file_path in sorted(self._inner.list_files(directory, recursive)):
+            if self.yielded == self._fail_after:
+                raise IOError("listing interrupted")
+            self.yielded += 1
+            yield file_path
+
+
+class TestRenameDirectory:
+    """Tests for concurrent directory renames"""
+    
+    @pytest.mark.parametrize("workers", [2, 8])
+    def test_parallel_matches_sequential(self, tmp_path, workers):
+        """Colliding targets resolve exactly as in a sequential run"""
+        runs = {}
+        for count in (1, workers):
+            root = make_tree(tmp_path / f"workers{count}", COLLIDING_FILES)
+            renamer = FileRenamerFactory.create_local_renamer()
+            renamer._file_ops = Listing(renamer._file_ops)
+            results = renamer.rename_directory(root, max_workers=count)
+            runs[count] = (outcome(root, results), tree_contents(root))
+        
+        assert runs[workers] == runs[1]
+        sequential_results, files = runs[1]
+        assert [r[0] for r in sequential_results] == sorted(COLLIDING_FILES)
+        assert len(files) == len(COLLIDING_FILES)
+        assert sorted(files.values()) == sorted(COLLIDING_FILES.values())
+    
+    @pytest.mark.parametrize("workers", [1, 4])
+    def test_listing_error_keeps_results(self, tmp_path, workers):
+        """Files listed before the listing failed are still reported"""
+        root = make_tree(tmp_path, {f"File {i}.txt": b"x%d" % i for i in range(6)})
+        renamer = FileRenamerFactory.create_local_renamer()
+        renamer._file_ops = Listing(renamer._file_ops, fail_after=3)
+        
+        results = renamer.rename_directory(root, recursive=False, max_workers=workers)
+        
+        assert [r.original_path.name for r in results] == ["File 0.txt", "File 1.txt", "File 2.txt"]
+        assert all(r.success and not r.skipped for r in results)
+        assert (root / "file-0.txt").exists()
+    
+    def test_pending_renames_bounded(self, tmp_path, monkeypatch):
+        """The listing is not consumed far ahead of the workers"""
+        monkeypatch.setattr(base, "QUEUED_RENAMES_PER_WORKER", 1)
+        root = make_tree(tmp_path, {f"File {i}.txt": b"x%d" % i for i in range(10)})
+        renamer = FileRenamerFactory.create_local_renamer()
+        listing = renamer._file_ops = Listing(renamer._file_ops)
+        
+        release = threading.Event()
+        hasher = renamer._hasher
+        
+        class BlockingHasher:
+            algorithm_name = hasher.algorithm_name
+            
+            def compute_hash(self, file_path):
+                release.wait()
+                return hasher.compute_hash(file_path)
+        
+        renamer._hasher = BlockingHasher()
+        results = []
+        worker = threading.Thread(
+            target=lambda: results.extend(
+                renamer.rename_directory(root, recursive=False, max_workers=2)
+            ),
+            daemon=True
+        )
+        worker.start()
+        try:
+            time.sleep(0.2)
+            # 2 workers x 1 pending rename each, plus the file waiting for a slot
+            yielded = listing.yielded
+        finally:
+            release.set()
+            worker.join(timeout=10)
+        
+        assert yielded <= 3
+        assert len(results) == 10
+        assert all(r.success for r in results)
+
+
+@pytest.fixture
+def renamer():
+    """Local renamer"""
+    return FileRenamerFactory.create_local_renamer()
+
+
+class TestRenameFileCollisions:
+    """Tests for renames whose target name is taken"""
+    
+    def test_existing_target_gets_suffix(self, tmp_path, renamer):
+        """A different file at the target is kept; the rename is suffixed"""
+        make_tree(tmp_path, {"My File.txt": b"new", "my-file.txt": b"existing"})
+        
+        result = renamer.rename_file(tmp_path / "My File.txt")
+        
+        assert result.success and not result.skipped
+        assert result.new_path.name.startswith("my-file--")
+        assert result.new_path.read_bytes() == b"new"
+        assert (tmp_path / "my-file.txt").read_bytes() == b"existing"
+        assert result.sidecar_path.exists()
+    
+    def test_already_renamed_skipped(self, tmp_path, renamer):
+        """A target whose sidecar names this file is an earlier run's rename"""
+        make_tree(tmp_path, {"My File.txt": b"first"})
+        assert renamer.rename_file(tmp_path / "My File.txt").success
+        make_tree(tmp_path, {"My File.txt": b"second"})
+        
+        result = renamer.rename_file(tmp_path / "My File.txt")
+        
+        assert result.skipped
+        assert result.error == "Already renamed"
+        assert (tmp_path / "My File.txt").read_bytes() == b"second"
+        assert (tmp_path / "my-file.txt").read_bytes() == b"first"
+    
+    def test_two_sources_same_target(self, tmp_path, renamer):
+        """The second file mapping to a taken name does not replace the first"""
+        make_tree(tmp_path, {"A B.txt": b"upper", "a b.txt": b"lower"})
+        
+        first = renamer.rename_file(tmp_path / "A B.txt")
+        second = renamer.rename_file(tmp_path / "a b.txt")
+        
+        assert first.new_path == tmp_path / "a-b.txt"
+        assert second.new_path.name.startswith("a-b--")
+        assert first.new_path.read_bytes() == b"upper"
+        assert second.new_path.read_bytes() == b"lower"
+        assert not (tmp_path / "A B.txt").exists()
+        assert not (tmp_path / "a b.txt").exists()
+    
+    def test_exclusive_rename_refuses_existing(self, tmp_path, renamer):
+        """The hard-link rename raises FileExistsError and changes nothing"""
+        make_tree(tmp_path, {"a.txt": b"source", "b.txt": b"target"})
+        
+        with pytest.raises(FileExistsError):
+            renamer._perform_rename_exclusive(tmp_path / "a.txt", tmp_path / "b.txt")
+        
+        assert (tmp_path / "a.txt").read_bytes() == b"source"
+        assert (tmp_path / "b.txt").read_bytes() == b"target"
+    
+    def test_exclusive_rename_without_hard_links(self, tmp_path, renamer, monkeypatch):
+        """Filesystems without hard links check the target, then rename"""
+        def no_links(*args, **kwargs):
+            raise PermissionError("hard links not supported")
+        
+        monkeypatch.setattr(os, "link", no_links)
+        make_tree(tmp_path, {"a.txt": b"source", "b.txt": b"target"})
+        
+        with pytest.raises(FileExistsError):
+            renamer._perform_rename_exclusive(tmp_path / "a.txt", tmp_path / "b.txt")
+        renamer._perform_rename_exclusive(tmp_path / "a.txt", tmp_path / "c.txt")
+        
+        assert not (tmp_path / "a.txt").exists()
+        assert (tmp_path / "b.txt").read_bytes() == b"target"
+        assert (tmp_path / "c.txt").read_bytes() == b"source"
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
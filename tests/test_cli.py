@@ -0,0 +1,71 @@
+"""
+Tests for the command-line entry point.
+
+Run with: pytest tests/ -v
+"""
+
+import logging
+
+import pytest
+from renamer_cli import BufferedFileHandler, parse_arguments
+
+
+class TestParseArguments:
+    """Tests for argument parsing"""
+    
+    @pytest.mark.parametrize("path", ["gdrive:photos", "C:/my files", "relative/dir"])
+    def test_fast_path_matches_argparse(self, path):
+        """A bare path skips argparse but yields the same arguments"""
+        fast = parse_arguments([path])
+        # '--' forces the argparse route for the same path
+        full = parse_arguments(["--", path])
+        
+        assert vars(fast) == vars(full)
+    
+    def test_options_use_argparse(self):
+        """Any option goes through argparse"""
+        args = parse_arguments(["gdrive:photos", "--dry-run", "--transfers", "4"])
+        
+        assert args.path == "gdrive:photos"
+        assert args.dry_run is True
+        assert args.transfers == 4
+    
+    def test_transfers_must_be_positive(self):
+        """--transfers 0 is rejected"""
+        with pytest.raises(SystemExit):
+            parse_arguments(["gdrive:photos", "--transfers", "0"])
+
+
+class TestBufferedFileHandler:
+    """Tests for the buffered log file handler"""
+    
+    @staticmethod
+    def _record(level, message):
+        return logging.LogRecord("test", level, __file__, 0, message, None, None)
+    
+    def test_buffers_below_flush_level(self, tmp_path):
+        """Debug records stay in the buffer until close"""
+        log_file = tmp_path / "run.log"
+        handler = BufferedFileHandler(log_file, flush_level=logging.ERROR)
+        try:
+            handler.emit(self._record(logging.DEBUG, "quiet"))
+            assert log_file.read_text() == ""
+        finally:
+            handler.close()
+        
+        assert log_file.read_text() == "quiet\n"
+    
+    def test_flushes_on_error_record(self, tmp_path):
+        """A record at flush_level reaches the file at once"""
+        log_file = tmp_path / "run.log"
+        handler = BufferedFileHandler(log_file, flush_level=logging.ERROR)
+        try:
+            handler.emit(self._record(logging.DEBUG, "before"))
+            handler.emit(self._record(logging.ERROR, "boom"))
+            assert log_file.read_text() == "before\nboom\n"
+        finally:
+            handler.close()
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
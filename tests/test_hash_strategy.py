@@ -0,0 +1,240 @@
+"""
+Tests for hash computers.
+
+Run with: pytest tests/ -v
+"""
+
+import hashlib
+import importlib.util
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from renamer import factory
+from renamer.core import hash_strategy
+from renamer.core.hash_strategy import (
+    LocalMD5HashComputer,
+    MD5HashComputer,
+    SHA256HashComputer,
+    get_hash_computer
+)
+from renamer.factory import FileRenamerFactory
+
+HAS_BLAKE3 = importlib.util.find_spec("blake3") is not None
+HAS_URING = (
+    sys.platform.startswith("linux") and importlib.util.find_spec("liburing") is not None
+)
+
+# Small read size so a few hundred bytes span several chunks
+CHUNK = 64
+
+# File sizes: empty, smaller than one chunk, several chunks plus a tail
+SIZES = [
+    pytest.param(0, id="empty"),
+    pytest.param(10, id="sub_chunk"),
+    pytest.param(CHUNK * 3 + 7, id="multi_chunk"),
+]
+
+
+def write_sample(directory, size):
+    """Write a file of size deterministic bytes; returns (path, data)"""
+    data = (bytes(range(256)) * (size // 256 + 1))[:size]
+    path = directory / f"sample_{size}.bin"
+    path.write_bytes(data)
+    return path, data
+
+
+@pytest.fixture
+def probe_calls(monkeypatch):
+    """Replace the SHA256 speed probe with one that records its calls"""
+    calls = []
+    
+    def fake_probe():
+        calls.append(True)
+        return True
+    
+    monkeypatch.setattr(hash_strategy, "sha256_is_accelerated", fake_probe)
+    return calls
+
+
+class TestSHA256Probe:
+    """Tests for when the SHA256 speed probe runs"""
+    
+    def test_not_run_by_constructor(self, probe_calls):
+        """Creating a SHA256 hasher does not time SHA256"""
+        SHA256HashComputer()
+        get_hash_computer(is_remote=False)
+        
+        assert probe_calls == []
+    
+    def test_run_for_prefer_fastest(self, probe_calls):
+        """prefer_fastest consults the probe"""
+        hasher = get_hash_computer(is_remote=False, prefer_fastest=True)
+        
+        assert probe_calls == [True]
+        assert isinstance(hasher, SHA256HashComputer)
+    
+    def test_run_once_by_factory(self, monkeypatch):
+        """Local renamers from the factory report a slow SHA256 once"""
+        calls = []
+        monkeypatch.setattr(factory, "sha256_is_accelerated", lambda: calls.append(True))
+        factory._local_components.cache_clear()
+        
+        FileRenamerFactory.create_local_renamer()
+        FileRenamerFactory.create_local_renamer()
+        FileRenamerFactory.create_local_renamer(hash_algorithm='md5')
+        factory._local_components.cache_clear()
+        
+        assert calls == [True]
+
+
+class TestFactoryHashSelection:
+    """Tests for the hash options reaching local renamers"""
+    
+    @pytest.fixture(autouse=True)
+    def fresh_components(self):
+        """Build the shared local components anew for each test"""
+        factory._local_components.cache_clear()
+        yield
+        factory._local_components.cache_clear()
+    
+    def test_default_sha256(self):
+        """SHA256 unless asked otherwise"""
+        renamer = FileRenamerFactory.create_local_renamer()
+        assert renamer._hasher.algorithm_name == 'sha256'
+    
+    def test_md5(self):
+        """create_from_path passes the algorithm on for local paths"""
+        renamer = FileRenamerFactory.create_from_path("/tmp", hash_algorithm='md5')
+        assert isinstance(renamer._hasher, LocalMD5HashComputer)
+    
+    @pytest.mark.skipif(not HAS_BLAKE3, reason="blake3 not installed")
+    def test_blake3(self):
+        """BLAKE3 is reachable from the factory"""
+        renamer = FileRenamerFactory.create_local_renamer(hash_algorithm='blake3')
+        assert renamer._hasher.algorithm_name == 'blake3'
+    
+    def test_options_share_components(self):
+        """Renamers with the same options share one hasher"""
+        first = FileRenamerFactory.create_local_renamer(hash_algorithm='md5')
+        second = FileRenamerFactory.create_local_renamer(hash_algorithm='md5')
+        assert first._hasher is second._hasher
+
+
+@pytest.mark.skipif(not HAS_BLAKE3, reason="blake3 not installed")
+class TestBLAKE3HashComputer:
+    """BLAKE3 digests match the blake3 package's reference"""
+    
+    @pytest.mark.parametrize("size", SIZES)
+    def test_matches_reference(self, tmp_path, size):
+        """Chunked hashing gives the one-shot digest"""
+        import blake3
+        path, data = write_sample(tmp_path, size)
+        
+        computer = hash_strategy.BLAKE3HashComputer(chunk_size=CHUNK)
+        
+        assert computer.compute_hash(path) == blake3.blake3(data).hexdigest()
+    
+    def test_multithreaded_matches_reference(self, tmp_path):
+        """Files above the threshold hash on several threads, same digest"""
+        import blake3
+        size = hash_strategy.BLAKE3HashComputer.MULTITHREADING_THRESHOLD + 1
+        path, data = write_sample(tmp_path, size)
+        
+        computer = hash_strategy.BLAKE3HashComputer()
+        
+        assert computer.compute_hash(path) == blake3.blake3(data).hexdigest()
+
+
+@pytest.mark.skipif(not HAS_URING, reason="io_uring hashing needs Linux and liburing")
+class TestUringSHA256HashComputer:
+    """io_uring SHA256 digests match hashlib"""
+    
+    @pytest.mark.parametrize("size", SIZES)
+    def test_matches_hashlib(self, tmp_path, size):
+        """Reads kept in flight are hashed in file order"""
+        path, data = write_sample(tmp_path, size)
+        
+        computer = hash_strategy.UringSHA256HashComputer(chunk_size=CHUNK, queue_depth=2)
+        
+        assert computer.compute_hash(path) == hashlib.sha256(data).hexdigest()
+    
+    def test_reuses_ring_across_files(self, tmp_path):
+        """One thread hashes several files on the same ring"""
+        computer = hash_strategy.UringSHA256HashComputer(chunk_size=CHUNK, queue_depth=2)
+        
+        for size in (CHUNK * 5, 3, 0):
+            path, data = write_sample(tmp_path, size)
+            assert computer.compute_hash(path) == hashlib.sha256(data).hexdigest()
+
+
+class TestLocalMD5HashComputer:
+    """Local MD5 digests match hashlib"""
+    
+    @pytest.mark.parametrize("size", SIZES)
+    def test_matches_hashlib(self, tmp_path, size):
+        """hashlib.file_digest path"""
+        path, data = write_sample(tmp_path, size)
+        
+        computer = hash_strategy.LocalMD5HashComputer(chunk_size=CHUNK)
+        
+        assert computer.compute_hash(path) == hashlib.md5(data).hexdigest()
+    
+    @pytest.mark.parametrize("size", SIZES)
+    def test_readinto_fallback_matches_hashlib(self, tmp_path, monkeypatch, size):
+        """Chunked readinto() path used before Python 3.11"""
+        monkeypatch.setattr(hash_strategy, "_HAS_FILE_DIGEST", False)
+        path, data = write_sample(tmp_path, size)
+        
+        computer = hash_strategy.LocalMD5HashComputer(chunk_size=CHUNK)
+        
+        assert computer.compute_hash(path) == hashlib.md5(data).hexdigest()
+
+
+class TestMD5HashComputer:
+    """Tests for the prefetched MD5 cache (rclone is mocked)"""
+    
+    @pytest.fixture
+    def lsjson(self, monkeypatch):
+        """Serve rclone lsjson from a settable relative path -> MD5 mapping"""
+        hashes = {}
+        
+        def fake_run(cmd, **kwargs):
+            if cmd[1] != 'lsjson':
+                raise subprocess.CalledProcessError(1, cmd, stderr="not prefetched")
+            entries = [{"Path": path, "Hashes": {"md5": md5}} for path, md5 in hashes.items()]
+            return subprocess.CompletedProcess(cmd, 0, stdout=json.dumps(entries).encode())
+        
+        monkeypatch.setattr(hash_strategy.subprocess, "run", fake_run)
+        return hashes
+    
+    def test_refetch_replaces_hashes(self, lsjson):
+        """A file replaced between two fetches gets its new hash"""
+        hasher = MD5HashComputer()
+        lsjson.update({"a.txt": "old", "b.txt": "bbb"})
+        hasher.compute_hashes_bulk(Path("r:dir"))
+        
+        lsjson.clear()
+        lsjson["a.txt"] = "new"
+        hasher.compute_hashes_bulk(Path("r:dir"))
+        
+        assert hasher.compute_hash(Path("r:dir/a.txt")) == "new"
+        with pytest.raises(IOError):
+            hasher.compute_hash(Path("r:dir/b.txt"))
+    
+    def test_clear_cache(self, lsjson):
+        """After clear_cache() hashes are asked for again"""
+        hasher = MD5HashComputer()
+        lsjson["a.txt"] = "aaa"
+        hasher.compute_hashes_bulk(Path("r:dir"))
+        
+        hasher.clear_cache()
+        
+        with pytest.raises(IOError):
+            hasher.compute_hash(Path("r:dir/a.txt"))
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,258 @@
+"""
+Tests for the rclone rcd client.
+
+Run with: pytest tests/ -v
+"""
+
+import base64
+import http.client
+import json
+from pathlib import Path
+from unittest import mock
+
+import pytest
+from renamer.core import rclone_rc
+from renamer.core.rclone_rc import RcloneRCClient, parse_rclone_json, split_remote_path
+
+
+class FakeResponse:
+    """Stands in for http.client.HTTPResponse"""
+    
+    def __init__(self, status, body):
+        self.status = status
+        self._body = body
+    
+    def read(self):
+        return self._body
+
+
+def make_client(status=200, body=b'{}', error=None):
+    """Client that believes its server runs, with a mocked connection"""
+    client = RcloneRCClient()
+    client._port = 5572
+    conn = mock.Mock()
+    if error is not None:
+        conn.request.side_effect = error
+    conn.getresponse.return_value = FakeResponse(status, body)
+    client._connection = lambda: conn
+    return client, conn
+
+
+class TestSplitRemotePath:
+    """Tests for splitting remote paths into rc fs/remote"""
+    
+    @pytest.mark.parametrize("path, expected", [
+        pytest.param("gdrive:folder/file.txt", ("gdrive:", "folder/file.txt"), id="nested"),
+        pytest.param("gdrive:file.txt", ("gdrive:", "file.txt"), id="top_level"),
+        pytest.param("gdrive:", ("gdrive:", ""), id="bare_remote"),
+        pytest.param("gdrive:a:b.txt", ("gdrive:", "a:b.txt"), id="colon_in_name"),
+    ])
+    def test_split(self, path, expected):
+        """fs is the remote with its colon, remote the rest"""
+        assert split_remote_path(path) == expected
+
+
+class TestParseRcloneJson:
+    """Tests for parsing rclone JSON output"""
+    
+    @pytest.mark.parametrize("payload", [b'{"Size": 3}', '{"Size": 3}'])
+    def test_bytes_and_str(self, payload):
+        """Both raw output and decoded text parse"""
+        assert parse_rclone_json(payload) == {"Size": 3}
+    
+    def test_without_orjson(self, monkeypatch):
+        """Falls back to the json module"""
+        monkeypatch.setattr(rclone_rc, "orjson", None)
+        assert parse_rclone_json(b'[{"Path": "a"}]') == [{"Path": "a"}]
+    
+    def test_invalid_raises_json_error(self):
+        """orjson's error is a JSONDecodeError too"""
+        with pytest.raises(json.JSONDecodeError):
+            parse_rclone_json(b'not json')
+
+
+class TestRcloneRCClientCall:
+    """Tests for rc call error handling"""
+    
+    def test_success(self):
+        """Parameters go out as JSON, the response is decoded"""
+        client, conn = make_client(body=b'{"hash": "abc"}')
+        
+        result = client.call('operations/hashsum', fs='r:a.txt')
+        
+        assert result == {"hash": "abc"}
+        method, path = conn.request.call_args.args
+        assert (method, path) == ('POST', '/operations/hashsum')
+        assert json.loads(conn.request.call_args.kwargs['body']) == {"fs": "r:a.txt"}
+    
+    def test_not_running(self):
+        """Calling before start() raises IOError"""
+        with pytest.raises(IOError, match="not running"):
+            RcloneRCClient().call('rc/noop')
+    
+    @pytest.mark.parametrize("error", [
+        ConnectionRefusedError("refused"),
+        http.client.RemoteDisconnected("gone"),
+    ])
+    def test_connection_error(self, error):
+        """Transport errors become IOError and drop the connection"""
+        client, conn = make_client(error=error)
+        
+        with pytest.raises(IOError, match="rc/noop failed"):
+            client.call('rc/noop')
+        conn.close.assert_called_once()
+    
+    def test_error_status(self):
+        """A non-200 reply raises with rclone's error message"""
+        client, _ = make_client(status=500, body=b'{"error": "object not found"}')
+        
+        with pytest.raises(IOError, match="object not found"):
+            client.call('operations/stat', fs='r:', remote='x')
+    
+    def test_invalid_json(self):
+        """An unparsable reply raises IOError"""
+        client, _ = make_client(body=b'<html>')
+        
+        with pytest.raises(IOError, match="Invalid rc response"):
+            client.call('rc/noop')
+    
+    def test_empty_body(self):
+        """An empty 200 reply is an empty result"""
+        client, _ = make_client(body=b'')
+        
+        assert client.call('rc/noop') == {}
+
+
+@pytest.fixture
+def fake_server(monkeypatch):
+    """rclone rcd replaced by mock processes; returns the started ones"""
+    started = []
+    
+    def popen(cmd, **kwargs):
+        process = mock.Mock(env=kwargs.get('env'))
+        process.poll.return_value = None
+        started.append((cmd, process))
+        return process
+    
+    monkeypatch.setattr(rclone_rc.subprocess, "Popen", popen)
+    monkeypatch.setattr(rclone_rc, "atexit", mock.Mock())
+    monkeypatch.setattr(RcloneRCClient, "call", mock.Mock(return_value={}))
+    monkeypatch.setattr(rclone_rc, "_shared_clients", {})
+    return started
+
+
+class TestServerLifetime:
+    """Tests for starting, sharing and shutting down rcd servers"""
+    
+    def test_start_and_close(self, fake_server):
+        """The server quits on close() and is no longer shut down at exit"""
+        client = RcloneRCClient()
+        client.start()
+        [(cmd, process)] = fake_server
+        
+        assert cmd[1] == 'rcd'
+        assert client.running
+        rclone_rc.atexit.register.assert_called_once_with(client.close)
+        
+        client.close()
+        
+        RcloneRCClient.call.assert_called_with('core/quit')
+        process.wait.assert_called_once()
+        rclone_rc.atexit.unregister.assert_called_once_with(client.close)
+        assert not client.running
+        assert client.port is None
+    
+    def test_retries_when_port_taken(self, fake_server):
+        """A server that exits before answering is started again"""
+        def noop(method):
+            if len(fake_server) == 1:
+                fake_server[0][1].poll.return_value = 1
+                raise IOError("connection refused")
+            return {}
+        RcloneRCClient.call.side_effect = noop
+        client = RcloneRCClient()
+        
+        client.start()
+        
+        assert len(fake_server) == 2
+        assert client.running
+    
+    def test_gives_up_after_attempts(self, fake_server):
+        """Repeated early exits raise IOError"""
+        def noop(method):
+            fake_server[-1][1].poll.return_value = 1
+            raise IOError("connection refused")
+        RcloneRCClient.call.side_effect = noop
+        client = RcloneRCClient()
+        
+        with pytest.raises(IOError, match="did not become ready"):
+            client.start()
+        assert len(fake_server) == rclone_rc.RC_START_ATTEMPTS
+        assert not client.running
+    
+    def test_shared_client_reused(self, fake_server):
+        """One server per rclone executable"""
+        first = rclone_rc.shared_rc_client()
+        
+        assert rclone_rc.shared_rc_client() is first
+        assert rclone_rc.shared_rc_client(None) is first
+        assert len(fake_server) == 1
+        
+        other = rclone_rc.shared_rc_client(Path("/opt/rclone"))
+        assert other is not first
+        assert len(fake_server) == 2
+    
+    def test_shared_client_restarted_after_exit(self, fake_server):
+        """A server that died or was closed is replaced"""
+        first = rclone_rc.shared_rc_client()
+        fake_server[0][1].poll.return_value = 1
+        
+        second = rclone_rc.shared_rc_client()
+        assert second is not first
+        
+        second.close()
+        third = rclone_rc.shared_rc_client()
+        assert third is not second
+        assert third.running
+        assert len(fake_server) == 3
+
+
+class TestAuthentication:
+    """Tests for the per-server rc credentials"""
+    
+    def test_calls_authenticate(self, monkeypatch):
+        """Credentials go to rclone's environment and into every request"""
+        started = []
+        conn = mock.Mock()
+        conn.getresponse.return_value = FakeResponse(200, b'{}')
+        
+        def popen(cmd, **kwargs):
+            started.append((cmd, kwargs['env']))
+            return mock.Mock()
+        
+        monkeypatch.setattr(rclone_rc.subprocess, "Popen", popen)
+        monkeypatch.setattr(rclone_rc, "atexit", mock.Mock())
+        monkeypatch.setattr(rclone_rc.http.client, "HTTPConnection", lambda *a, **kw: conn)
+        
+        client = RcloneRCClient()
+        client.start()
+        
+        [(cmd, env)] = started
+        user, password = env['RCLONE_RC_USER'], env['RCLONE_RC_PASS']
+        assert user and password
+        assert '--rc-no-auth' not in cmd
+        assert not any(password in arg for arg in cmd)
+        expected = 'Basic ' + base64.b64encode(f'{user}:{password}'.encode()).decode()
+        assert conn.request.call_args.kwargs['headers']['Authorization'] == expected
+    
+    def test_fresh_credentials_per_server(self, fake_server):
+        """Two servers never share a password"""
+        RcloneRCClient().start()
+        RcloneRCClient().start()
+        
+        [(_, first), (_, second)] = fake_server
+        assert first.env['RCLONE_RC_PASS'] != second.env['RCLONE_RC_PASS']
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,322 @@
+"""
+Tests for remote file operations (rclone is mocked).
+
+Run with: pytest tests/ -v
+"""
+
+import subprocess
+from pathlib import Path
+from unittest import mock
+
+import pytest
+from renamer.operations import remote
+from renamer.core.sanitizer import FilenameSanitizer
+from renamer.operations.remote import RemoteFileOperations, RemoteFileRenamer
+
+
+class FakeProcess:
+    """Stands in for the rclone lsf process list_files() reads from"""
+    
+    def __init__(self, lines, returncode):
+        self.stdout = iter(lines)
+        self.returncode = returncode
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        return False
+    
+    def kill(self):
+        self.returncode = -9
+
+
+class FakeRclone:
+    """
+    Replaces rclone processes: lsf listings come from `listings`
+    (directory -> lsf lines), other commands from `responses`
+    (subcommand -> callable returning stdout or raising).
+    """
+    
+    def __init__(self):
+        self.listings = {}
+        self.responses = {}
+        self.calls = []
+    
+    def popen(self, cmd, stdout, stderr, **kwargs):
+        self.calls.append(cmd[1:])
+        lines = self.listings.get(cmd[-1])
+        if lines is None:
+            stderr.write(b"directory not found")
+            return FakeProcess([], 3)
+        return FakeProcess(lines, 0)
+    
+    def run(self, cmd, **kwargs):
+        self.calls.append(cmd[1:])
+        respond = self.responses.get(cmd[1])
+        stdout = respond(cmd) if respond else ''
+        return subprocess.CompletedProcess(cmd, 0, stdout=stdout, stderr='')
+    
+    def subcommands(self):
+        return [call[0] for call in self.calls]
+
+
+@pytest.fixture
+def rclone(monkeypatch):
+    """Fake rclone wired into the remote module"""
+    fake = FakeRclone()
+    monkeypatch.setattr(remote.subprocess, "Popen", fake.popen)
+    monkeypatch.setattr(remote.subprocess, "run", fake.run)
+    return fake
+
+
+@pytest.fixture
+def ops(rclone):
+    """Operations over the fake rclone, with r:dir listed non-recursively"""
+    rclone.listings["r:dir"] = ["A File.txt|3\n", "b.txt|\n"]
+    ops = RemoteFileOperations()
+    assert list(ops.list_files(Path("r:dir"))) == [Path("r:dir/A File.txt"), Path("r:dir/b.txt")]
+    rclone.calls.clear()
+    return ops
+
+
+def called_process_error(stderr):
+    """Raiser for FakeRclone.responses"""
+    def respond(cmd):
+        raise subprocess.CalledProcessError(1, cmd, stderr=stderr)
+    return respond
+
+
+class TestListingRecord:
+    """Sizes and existence of listed files come from the listing"""
+    
+    def test_listed_size_and_existence(self, ops, rclone):
+        """Listed files are answered without running rclone"""
+        assert ops.get_file_size(Path("r:dir/A File.txt")) == 3
+        assert ops.file_exists(Path("r:dir/A File.txt"))
+        assert ops.file_exists(Path("r:dir/b.txt"))
+        assert rclone.calls == []
+    
+    def test_unknown_size_asks_remote(self, ops, rclone):
+        """A listed file without a size is looked up"""
+        rclone.responses["lsjson"] = lambda cmd: b'{"Size": 7}'
+        
+        assert ops.get_file_size(Path("r:dir/b.txt")) == 7
+        assert rclone.subcommands() == ["lsjson"]
+    
+    def test_rename_moves_record(self, ops, rclone):
+        """After a rename the new name is known with its size"""
+        ops.rename_file(Path("r:dir/A File.txt"), Path("r:dir/a-file.txt"))
+        
+        assert rclone.subcommands() == ["moveto"]
+        assert ops.get_file_size(Path("r:dir/a-file.txt")) == 3
+        assert ops.file_exists(Path("r:dir/a-file.txt"))
+        assert rclone.subcommands() == ["moveto"]
+
+
+class TestMissingFromListing:
+    """Unlisted names in a listed directory are known to be missing"""
+    
+    def test_unlisted_name_missing(self, ops, rclone):
+        """No rclone call for a name the listing did not contain"""
+        assert not ops.file_exists(Path("r:dir/new-name.txt"))
+        assert rclone.calls == []
+    
+    def test_case_variant_asks_remote(self, ops, rclone):
+        """A name differing only in case may exist on case-insensitive remotes"""
+        rclone.responses["lsf"] = lambda cmd: "a file.txt\n"
+        
+        assert ops.file_exists(Path("r:dir/a file.txt"))
+        assert rclone.subcommands() == ["lsf"]
+    
+    def test_subdirectory_of_flat_listing_asks_remote(self, ops, rclone):
+        """A non-recursive listing says nothing about subdirectories"""
+        assert not ops.file_exists(Path("r:dir/sub/x.txt"))
+        assert rclone.subcommands() == ["lsf"]
+    
+    def test_subdirectory_of_recursive_listing(self, rclone):
+        """A recursive listing covers subdirectories"""
+        rclone.listings["r:dir"] = ["sub/x.txt|1\n"]
+        ops = RemoteFileOperations()
+        list(ops.list_files(Path("r:dir"), recursive=True))
+        rclone.calls.clear()
+        
+        assert ops.file_exists(Path("r:dir/sub/x.txt"))
+        assert not ops.file_exists(Path("r:dir/sub/y.txt"))
+        assert rclone.calls == []
+    
+    def test_failed_listing_not_trusted(self, rclone, caplog):
+        """A listing that failed does not mark names missing"""
+        ops = RemoteFileOperations()
+        
+        assert list(ops.list_files(Path("r:gone"))) == []
+        assert "directory not found" in caplog.text
+        
+        ops.file_exists(Path("r:gone/x.txt"))
+        assert rclone.subcommands()[-1] == "lsf"
+    
+    def test_abandoned_listing_not_trusted(self, rclone):
+        """A listing stopped early does not mark names missing"""
+        rclone.listings["r:dir"] = ["a.txt|1\n", "b.txt|1\n"]
+        ops = RemoteFileOperations()
+        listing = ops.list_files(Path("r:dir"))
+        next(listing)
+        listing.close()
+        rclone.calls.clear()
+        
+        ops.file_exists(Path("r:dir/b.txt"))
+        assert rclone.subcommands() == ["lsf"]
+
+
+class TestListingRefresh:
+    """Records of earlier listings are not trusted once stale"""
+    
+    def test_relisting_replaces_record(self, ops, rclone):
+        """A target created between two listings is seen by the second"""
+        assert not ops.file_exists(Path("r:dir/new-name.txt"))
+        rclone.listings["r:dir"] = ["new-name.txt|2\n"]
+        
+        list(ops.list_files(Path("r:dir")))
+        rclone.calls.clear()
+        
+        assert ops.file_exists(Path("r:dir/new-name.txt"))
+        assert not ops.file_exists(Path("r:dir/b.txt"))
+        assert rclone.calls == []
+    
+    def test_relisting_subdirectory_drops_parent_listing(self, rclone):
+        """Listing a subdirectory again stops trusting its parent's listing"""
+        rclone.listings["r:dir"] = ["sub/x.txt|1\n", "other/z.txt|1\n"]
+        rclone.listings["r:dir/sub"] = ["y.txt|1\n"]
+        ops = RemoteFileOperations()
+        list(ops.list_files(Path("r:dir"), recursive=True))
+        list(ops.list_files(Path("r:dir/sub")))
+        rclone.calls.clear()
+        
+        assert ops.file_exists(Path("r:dir/sub/y.txt"))
+        assert not ops.file_exists(Path("r:dir/sub/x.txt"))
+        assert rclone.calls == []
+        
+        ops.file_exists(Path("r:dir/other/new.txt"))
+        assert rclone.subcommands() == ["lsf"]
+    
+    def test_directory_runs_forget_listing(self, ops, rclone):
+        """A target appearing after a run is checked on the remote"""
+        renamer = RemoteFileRenamer(
+            hasher=mock.Mock(),
+            sidecar_writer=mock.Mock(),
+            file_operations=ops,
+            sanitizer=FilenameSanitizer()
+        )
+        target = Path("r:dir/a-file.txt")
+        
+        results = renamer.rename_directory(Path("r:dir"), recursive=False, dry_run=True)
+        assert target in [r.new_path for r in results]
+        
+        rclone.calls.clear()
+        rclone.responses["lsf"] = lambda cmd: "a-file.txt\n"
+        assert ops.file_exists(target)
+        assert rclone.subcommands() == ["lsf"]
+    
+    def test_directory_run_starts_no_server(self, ops, rclone, monkeypatch):
+        """Without an rc_client a live run renames with rclone processes"""
+        monkeypatch.setattr(remote.RcloneRCClient, "start", mock.Mock())
+        hasher = mock.Mock(algorithm_name="md5")
+        hasher.compute_hash.return_value = "abc"
+        writer = mock.Mock()
+        writer.read_sidecar.return_value = None
+        renamer = RemoteFileRenamer(
+            hasher=hasher,
+            sidecar_writer=writer,
+            file_operations=ops,
+            sanitizer=FilenameSanitizer()
+        )
+        
+        renamer.rename_directory(Path("r:dir"), recursive=False)
+        
+        remote.RcloneRCClient.start.assert_not_called()
+        assert "moveto" in rclone.subcommands()
+
+
+class TestGetFileSize:
+    """Sizes of unlisted files"""
+    
+    def test_lsjson_stat(self, rclone):
+        """One lsjson --stat call"""
+        rclone.responses["lsjson"] = lambda cmd: b'{"Path": "x.txt", "Size": 42}'
+        
+        assert RemoteFileOperations().get_file_size(Path("r:x.txt")) == 42
+        assert rclone.calls == [("lsjson", "--stat", "r:x.txt")]
+    
+    def test_old_rclone_falls_back_to_size(self, rclone):
+        """Releases without --stat use size --json"""
+        rclone.responses["lsjson"] = called_process_error(b"Error: unknown flag: --stat")
+        rclone.responses["size"] = lambda cmd: b'{"count": 1, "bytes": 42}'
+        
+        assert RemoteFileOperations().get_file_size(Path("r:x.txt")) == 42
+        assert rclone.subcommands() == ["lsjson", "size"]
+    
+    def test_other_errors_raise(self, rclone):
+        """A missing file is an IOError, without the fallback"""
+        rclone.responses["lsjson"] = called_process_error(b"object not found")
+        
+        with pytest.raises(IOError, match="Failed to get file size"):
+            RemoteFileOperations().get_file_size(Path("r:x.txt"))
+        assert rclone.subcommands() == ["lsjson"]
+
+
+class TestRcOperations:
+    """With an rc client no rclone process is started"""
+    
+    @pytest.fixture
+    def rc(self):
+        rc = mock.Mock()
+        rc.list_files.return_value = [
+            {"Path": "dir/a.txt", "Size": 5},
+            {"Path": "dir/b.txt", "Size": -1},
+        ]
+        rc.stat.return_value = {"Size": 9}
+        return rc
+    
+    def test_listing_and_sizes(self, rclone, rc):
+        """Listed over rc, sizes recorded, unknown sizes from stat"""
+        ops = RemoteFileOperations(rc_client=rc)
+        
+        assert list(ops.list_files(Path("r:dir"))) == [Path("r:dir/a.txt"), Path("r:dir/b.txt")]
+        assert ops.get_file_size(Path("r:dir/a.txt")) == 5
+        assert ops.get_file_size(Path("r:dir/b.txt")) == 9
+        assert not ops.file_exists(Path("r:dir/c.txt"))
+        rc.stat.assert_called_once_with(Path("r:dir/b.txt"))
+        assert rclone.calls == []
+    
+    def test_rename_within_remote_moves(self, rclone, rc):
+        """One server-side move"""
+        ops = RemoteFileOperations(rc_client=rc)
+        
+        ops.rename_file(Path("r:a.txt"), Path("r:b.txt"))
+        
+        rc.move_file.assert_called_once_with(Path("r:a.txt"), Path("r:b.txt"))
+        rc.copy_file.assert_not_called()
+        assert rclone.calls == []
+    
+    def test_rename_across_remotes_copies(self, rclone, rc):
+        """Copy, verify, then delete the original"""
+        ops = RemoteFileOperations(rc_client=rc)
+        
+        ops.rename_file(Path("r:a.txt"), Path("s:a.txt"))
+        
+        rc.copy_file.assert_called_once_with(Path("r:a.txt"), Path("s:a.txt"))
+        rc.delete_file.assert_called_once_with(Path("r:a.txt"))
+        rc.move_file.assert_not_called()
+    
+    def test_unverified_copy_keeps_original(self, rclone, rc):
+        """The original stays when the copy cannot be found"""
+        rc.stat.return_value = None
+        ops = RemoteFileOperations(rc_client=rc)
+        
+        with pytest.raises(IOError, match="verification failed"):
+            ops.rename_file(Path("r:a.txt"), Path("s:a.txt"))
+        rc.delete_file.assert_not_called()
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
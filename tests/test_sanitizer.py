@@ -4,57 +4,62 @@ Basic tests for file-renamer package.
 Run with: pytest tests/ -v
 """
 
+import importlib.util
+
 import pytest
-from pathlib import Path
 from renamer.core.sanitizer import FilenameSanitizer
 
 
+# (original, expected) pairs, one per sanitization rule
+SANITIZE_CASES = [
+    pytest.param("valid_file.txt", "valid-file.txt", id="simple_clean_filename"),
+    pytest.param("file@2024#.txt", "file2024.txt", id="remove_special_characters"),
+    pytest.param('file<>:"|?*.txt', "file.txt", id="windows_forbidden_chars"),
+    pytest.param("my file name.txt", "my-file-name.txt", id="spaces_to_hyphens"),
+    pytest.param("file   name.txt", "file-name.txt", id="multiple_spaces"),
+    pytest.param("  file.txt  ", "file.txt", id="trim_whitespace"),
+    pytest.param("file[1](2){3}.txt", "file123.txt", id="brackets_removed"),
+    pytest.param("My File!.PDF", "my-file.pdf", id="lowercase_extension"),
+]
+
+# (filename, needs rename) pairs
+NEEDS_RENAME_CASES = [
+    pytest.param("file@2024.txt", True, id="needs_rename_true"),
+    pytest.param("clean_file.txt", False, id="needs_rename_false"),
+]
+
+HAS_BENCHMARK = importlib.util.find_spec("pytest_benchmark") is not None
+
+
+@pytest.fixture(scope="class")
+def sanitizer():
+    """One sanitizer shared by the whole class (it is stateless)"""
+    return FilenameSanitizer()
+
+
 class TestFilenameSanitizer:
     """Tests for filename sanitization"""
     
-    def setup_method(self):
-        """Setup for each test"""
-        self.sanitizer = FilenameSanitizer()
-    
-    def test_simple_clean_filename(self):
-        """Test already clean filename passes through"""
-        assert self.sanitizer.sanitize("valid_file.txt") == "valid_file.txt"
-    
-    def test_remove_special_characters(self):
-        """Test removal of special characters"""
-        assert self.sanitizer.sanitize("file@2024#.txt") == "file_2024_.txt"
-    
-    def test_windows_forbidden_chars(self):
-        """Test Windows forbidden characters are replaced"""
-        assert self.sanitizer.sanitize('file<>:"|?*.txt') == "file_______.txt"
-    
-    def test_spaces_to_underscores(self):
-        """Test spaces converted to underscores"""
-        assert self.sanitizer.sanitize("my file name.txt") == "my_file_name.txt"
-    
-    def test_multiple_spaces(self):
-        """Test multiple spaces become single underscore"""
-        assert self.sanitizer.sanitize("file   name.txt") == "file_name.txt"
-    
-    def test_trim_whitespace(self):
-        """Test leading/trailing whitespace removed"""
-        assert self.sanitizer.sanitize("  file.txt  ") == "file.txt"
-    
-    def test_brackets_removed(self):
-        """Test brackets are replaced"""
-        assert self.sanitizer.sanitize("file[1](2){3}.txt") == "file_1__2__3_.txt"
-    
-    def test_preserve_extension(self):
-        """Test file extension is preserved"""
-        assert self.sanitizer.sanitize("My File!.PDF") == "My_File_.PDF"
+    @pytest.mark.parametrize("original, expected", SANITIZE_CASES)
+    def test_sanitize(self, sanitizer, original, expected):
+        """Test each sanitization rule"""
+        assert sanitizer.sanitize(original) == expected
     
-    def test_needs_rename_true(self):
-        """Test needs_rename returns True for problematic names"""
-        assert self.sanitizer.needs_rename("file@2024.txt") is True
+    @pytest.mark.parametrize("filename, expected", NEEDS_RENAME_CASES)
+    def test_needs_rename(self, sanitizer, filename, expected):
+        """Test needs_rename detects problematic names"""
+        assert sanitizer.needs_rename(filename) is expected
     
-    def test_needs_rename_false(self):
-        """Test needs_rename returns False for clean names"""
-        assert self.sanitizer.needs_rename("clean_file.txt") is False
+    @pytest.mark.skipif(not HAS_BENCHMARK, reason="pytest-benchmark not installed")
+    def test_sanitize_benchmark(self, sanitizer, benchmark):
+        """Benchmark sanitizing the whole case table (one call per file in a run)"""
+        names = [case.values[0] for case in SANITIZE_CASES]
+        
+        def sanitize_all():
+            for name in names:
+                sanitizer.sanitize(name)
+        
+        benchmark(sanitize_all)
 
 
 if __name__ == '__main__':
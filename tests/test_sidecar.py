@@ -0,0 +1,203 @@
+"""
+Tests for sidecar writers.
+
+Run with: pytest tests/ -v
+"""
+
+import json
+import os
+import subprocess
+from pathlib import Path
+from unittest import mock
+
+import pytest
+from renamer.core import sidecar
+from renamer.core.sidecar import RcloneSidecarWriter
+from renamer.protocols import serialize_sidecar
+from renamer.domain.models import SidecarContent
+
+
+CONTENT = SidecarContent(
+    original_filename="A File.txt",
+    safe_filename="a-file.txt",
+    file_size_bytes=3,
+    hash="abc",
+    hash_algorithm="md5",
+    renamed_at="2024-01-01T00:00:00"
+)
+
+
+def snapshot(local_dir):
+    """Map each file below local_dir (as a posix relative path) to its bytes"""
+    files = {}
+    for dirpath, _, filenames in os.walk(local_dir):
+        for name in filenames:
+            path = Path(dirpath, name)
+            files[path.relative_to(local_dir).as_posix()] = path.read_bytes()
+    return files
+
+
+@pytest.fixture
+def writer():
+    """Batching writer whose tree copy and single uploads are recorded"""
+    writer = RcloneSidecarWriter(rclone_path=Path("rclone-not-run"))
+    writer.copies = []
+    writer.uploads = []
+    
+    def copy_tree(local_dir, remote_root):
+        writer.copies.append((remote_root, snapshot(local_dir)))
+    
+    def upload(sidecar_path, payload):
+        writer.uploads.append(str(sidecar_path))
+    
+    writer._copy_tree = copy_tree
+    writer._upload = upload
+    writer.begin_batch()
+    return writer
+
+
+class TestFlushBatch:
+    """Tests for uploading staged sidecars in one copy"""
+    
+    @pytest.mark.parametrize("root, files, expected", [
+        pytest.param(
+            "remote:", ["a.txt", "sub/b.txt"],
+            {"a.txt.meta.json", "sub/b.txt.meta.json"},
+            id="bare_remote"
+        ),
+        pytest.param(
+            "remote:sub/dir", ["a.txt", "deeper/b.txt"],
+            {"a.txt.meta.json", "deeper/b.txt.meta.json"},
+            id="remote_subdirectory"
+        ),
+    ])
+    def test_stages_below_temp_dir(self, writer, root, files, expected):
+        """Sidecars are laid out relative to the root, inside the temp dir"""
+        for name in files:
+            writer.write_sidecar(Path(root) / name, CONTENT)
+        
+        uploaded = writer.flush_batch(Path(root))
+        
+        assert len(uploaded) == len(files)
+        assert writer.uploads == []
+        [(remote_root, staged)] = writer.copies
+        assert remote_root == str(Path(root))
+        assert set(staged) == expected
+        assert all(payload == serialize_sidecar(CONTENT) for payload in staged.values())
+    
+    def test_outside_root_uploaded_singly(self, writer):
+        """A sidecar not below the root is uploaded on its own"""
+        writer.write_sidecar(Path("remote:dir/a.txt"), CONTENT)
+        writer.write_sidecar(Path("other:b.txt"), CONTENT)
+        
+        writer.flush_batch(Path("remote:dir"))
+        
+        assert writer.uploads == ["other:b.txt.meta.json"]
+        [(_, staged)] = writer.copies
+        assert set(staged) == {"a.txt.meta.json"}
+    
+    def test_bare_remote_over_rc(self):
+        """With an rc client the staged tree is copied by sync/copy"""
+        rc = mock.Mock()
+        copies = []
+        rc.call.side_effect = lambda method, srcFs, dstFs: copies.append(
+            (method, dstFs, snapshot(srcFs))
+        )
+        writer = RcloneSidecarWriter(rc_client=rc)
+        writer.begin_batch()
+        writer.write_sidecar(Path("remote:") / "a.txt", CONTENT)
+        
+        writer.flush_batch(Path("remote:"))
+        
+        assert copies == [("sync/copy", "remote:", {"a.txt.meta.json": serialize_sidecar(CONTENT)})]
+        rc.write_bytes.assert_not_called()
+    
+    def test_empty_batch(self, writer):
+        """Nothing staged, nothing copied"""
+        assert writer.flush_batch(Path("remote:")) == []
+        assert writer.copies == []
+
+
+class TestIntermediateFlush:
+    """Tests for uploading staged sidecars during the run"""
+    
+    def test_uploads_every_n(self, writer):
+        """Each full batch is copied at once, the rest at flush_batch()"""
+        writer.begin_batch(Path("remote:dir"), flush_every=2)
+        for name in ("a.txt", "b.txt", "c.txt"):
+            writer.write_sidecar(Path("remote:dir") / name, CONTENT)
+        
+        assert [set(staged) for _, staged in writer.copies] == [
+            {"a.txt.meta.json", "b.txt.meta.json"}
+        ]
+        assert writer.staged_sidecars() == {"remote:dir/c.txt.meta.json"}
+        
+        writer.flush_batch(Path("remote:dir"))
+        assert set(writer.copies[-1][1]) == {"c.txt.meta.json"}
+        assert len(writer.copies) == 2
+    
+    def test_failed_upload_retried_at_flush(self, writer):
+        """A failed intermediate upload is staged again, not lost"""
+        def fail(local_dir, remote_root):
+            raise IOError("network down")
+        writer._copy_tree = fail
+        writer.begin_batch(Path("remote:dir"), flush_every=1)
+        
+        writer.write_sidecar(Path("remote:dir/a.txt"), CONTENT)
+        
+        assert writer.staged_sidecars() == {"remote:dir/a.txt.meta.json"}
+        with pytest.raises(IOError, match="network down"):
+            writer.flush_batch(Path("remote:dir"))
+    
+    def test_without_root_waits_for_flush(self, writer):
+        """begin_batch() without a root keeps everything until the end"""
+        for index in range(5):
+            writer.write_sidecar(Path(f"remote:dir/{index}.txt"), CONTENT)
+        
+        assert writer.copies == []
+        assert len(writer.staged_sidecars()) == 5
+
+
+class TestSidecarIndex:
+    """Tests for the index of existing remote sidecars (rclone is mocked)"""
+    
+    @pytest.fixture
+    def rclone(self, monkeypatch):
+        """Serve lsjson from a settable list of sidecar names; record cat calls"""
+        fake = mock.Mock(sidecars=[], cats=[])
+        
+        def fake_run(cmd, **kwargs):
+            if cmd[1] == 'cat':
+                fake.cats.append(cmd[2])
+                return subprocess.CompletedProcess(cmd, 0, stdout=serialize_sidecar(CONTENT))
+            entries = [{"Path": name} for name in fake.sidecars]
+            return subprocess.CompletedProcess(cmd, 0, stdout=json.dumps(entries).encode())
+        
+        monkeypatch.setattr(sidecar.subprocess, "run", fake_run)
+        return fake
+    
+    def test_reindex_sees_new_sidecar(self, rclone):
+        """A sidecar written between two indexings is read"""
+        writer = RcloneSidecarWriter()
+        writer.index_sidecars(Path("r:dir"))
+        assert writer.read_sidecar(Path("r:dir/a.txt")) is None
+        
+        rclone.sidecars.append("a.txt.meta.json")
+        writer.index_sidecars(Path("r:dir"))
+        
+        assert writer.read_sidecar(Path("r:dir/a.txt")) == CONTENT
+        assert rclone.cats == ["r:dir/a.txt.meta.json"]
+    
+    def test_clear_index(self, rclone):
+        """After clear_index() unindexed sidecars are looked up"""
+        writer = RcloneSidecarWriter()
+        writer.index_sidecars(Path("r:dir"))
+        
+        writer.clear_index()
+        
+        assert writer.read_sidecar(Path("r:dir/a.txt")) == CONTENT
+        assert rclone.cats == ["r:dir/a.txt.meta.json"]
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])